@@ -0,0 +1,92 @@
+"""
+Batched UDP receive using recvmmsg(2) through ctypes.
+
+recvmmsg drains several datagrams from a socket in a single system call, which
+keeps the receiver cheap when packets arrive faster than the display loop runs.
+It is only available on Linux; check RECVMMSG_AVAILABLE before using
+BatchReceiver.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import sys
+
+class iovec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t)
+    ]
+
+class msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int)
+    ]
+
+class mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", msghdr),
+        ("msg_len", ctypes.c_uint)
+    ]
+
+_recvmmsg = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(mmsghdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _recvmmsg = None
+
+RECVMMSG_AVAILABLE = _recvmmsg is not None
+
+class BatchReceiver:
+    def __init__(self, sock, count=32, size=4096):
+        """Preallocate buffers for receiving up to count datagrams of size bytes per call"""
+        if not RECVMMSG_AVAILABLE:
+            raise OSError("recvmmsg is not available on this platform")
+
+        self.sock = sock
+        self.count = count
+        self.size = size
+
+        # One contiguous buffer split into count slots
+        self._buf = bytearray(count * size)
+        self._view = memoryview(self._buf)
+        self._cbuf = (ctypes.c_char * len(self._buf)).from_buffer(self._buf)
+        base = ctypes.addressof(self._cbuf)
+
+        # Message headers pointing each slot at its part of the buffer
+        self._iov = (iovec * count)()
+        self._msgs = (mmsghdr * count)()
+        for i in range(count):
+            self._iov[i].iov_base = base + i * size
+            self._iov[i].iov_len = size
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iov[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self):
+        """Receive pending datagrams without blocking.
+
+        Returns a list of memoryviews into the internal buffer; they are only
+        valid until the next call.
+        """
+        n = _recvmmsg(self.sock.fileno(), self._msgs, self.count, socket.MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        size = self.size
+        msgs = self._msgs
+        return [self._view[i * size:i * size + msgs[i].msg_len] for i in range(n)]
@@ -8,78 +8,144 @@ In this case, we're creating a simple visualization of the controller position.
 
 import socket
 import json
+import struct
 import time
+import sys
 import argparse
 import math
+import numpy as np
 try:
-    # Try to import matplotlib for visualization
-    import matplotlib.pyplot as plt
-    from matplotlib.animation import FuncAnimation
-    MATPLOTLIB_AVAILABLE = True
+    # orjson parses bytes directly and is much faster than the stdlib decoder
+    from orjson import loads as json_loads
 except ImportError:
-    print("Matplotlib not available. Running in text-only mode.")
-    MATPLOTLIB_AVAILABLE = False
+    def json_loads(data):
+        """Parse JSON from bytes-like data"""
+        return json.loads(bytes(data))
+from _recvmmsg import BatchReceiver, RECVMMSG_AVAILABLE
+
+# Binary packet layout sent by main.py with --wire binary (must match PACKET there)
+PACKET_MAGIC = b"VV"
+PACKET = struct.Struct("<2sd" + "B3f3fQQ3f" * 2)
+HAND_FIELDS = 12
+
+# OpenVR button IDs (openvr.k_EButton_*) used to decode the raw button masks
+BUTTON_IDS = {"system": 0, "menu": 1, "grip": 2, "trigger": 33}
+TRACKPAD_BUTTON_ID = 32
+
+def unpack_packet(data):
+    """Decode a binary packet into the same structure as the JSON format"""
+    fields = PACKET.unpack_from(data)
+    controller_data = {"timestamp": fields[1]}
+    for i, hand in enumerate(["left", "right"]):
+        (tracked, x, y, z, roll, pitch, yaw, pressed, touched,
+         trigger, trackpad_x, trackpad_y) = fields[2 + i * HAND_FIELDS:2 + (i + 1) * HAND_FIELDS]
+        
+        buttons = {name: (pressed >> button_id) & 1 == 1 for name, button_id in BUTTON_IDS.items()}
+        buttons["trackpad"] = {
+            "pressed": (pressed >> TRACKPAD_BUTTON_ID) & 1 == 1,
+            "touched": (touched >> TRACKPAD_BUTTON_ID) & 1 == 1
+        }
+        
+        controller_data[hand] = {
+            "tracked": tracked == 1,
+            "position": {"x": x, "y": y, "z": z},
+            "rotation": {"roll": roll, "pitch": pitch, "yaw": yaw},
+            "buttons": buttons,
+            "analog": {"trigger": trigger, "trackpad": {"x": trackpad_x, "y": trackpad_y}}
+        }
+    return controller_data
 
 class ViveDataReceiver:
     def __init__(self, port=5555):
         """Initialize the receiver with the specified port"""
         self.port = port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Larger receive buffer to absorb bursts between updates
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
         self.sock.bind(("0.0.0.0", port))
         self.sock.setblocking(False)
         
+        # Drain up to batch_size datagrams per update (one recvmmsg call on Linux)
+        self.batch_size = 32
+        self.batch_receiver = BatchReceiver(self.sock, self.batch_size) if RECVMMSG_AVAILABLE else None
+        
+        # Reusable receive buffer for the recvfrom_into fallback
+        self._rxbuf = bytearray(4096)
+        self._rxview = memoryview(self._rxbuf)
+        
         # Initialize data storage
         self.latest_data = None
-        self.position_history = {
-            "left": {"x": [], "y": [], "z": []},
-            "right": {"x": [], "y": [], "z": []}
-        }
         self.max_history = 100  # Maximum number of positions to store
         
+        # Position history as fixed-size ring buffers (one row per sample: x, y, z).
+        # Every sample is written twice, max_history rows apart, so the most recent
+        # samples are always available as one contiguous slice.
+        self.pos_buf = {
+            "left": np.empty((2 * self.max_history, 3), dtype=np.float32),
+            "right": np.empty((2 * self.max_history, 3), dtype=np.float32)
+        }
+        self.pos_head = {"left": 0, "right": 0}  # Next write index
+        self.pos_count = {"left": 0, "right": 0}  # Number of valid samples
+        
         print(f"Listening for controller data on port {port}...")
     
     def update(self):
         """Check for new data and update the internal state"""
+        updated = False
+        if self.batch_receiver is not None:
+            for data in self.batch_receiver.recv():
+                if self.handle_packet(data):
+                    updated = True
+        else:
+            for _ in range(self.batch_size):
+                try:
+                    # Try to receive data (non-blocking) into the reusable buffer
+                    n, addr = self.sock.recvfrom_into(self._rxbuf)
+                except BlockingIOError:
+                    # No more data available
+                    break
+                if self.handle_packet(self._rxview[:n]):
+                    updated = True
+        return updated
+    
+    def handle_packet(self, data):
+        """Parse a single datagram and update the internal state"""
         try:
-            # Try to receive data (non-blocking)
-            data, addr = self.sock.recvfrom(4096)
-            
-            try:
-                # Parse JSON data
-                self.latest_data = json.loads(data.decode())
-                
-                # Update position history
-                for hand in ["left", "right"]:
-                    if hand in self.latest_data and self.latest_data[hand].get("tracked", False):
-                        pos = self.latest_data[hand]["position"]
-                        
-                        # Add new position to history
-                        self.position_history[hand]["x"].append(pos["x"])
-                        self.position_history[hand]["y"].append(pos["y"])
-                        self.position_history[hand]["z"].append(pos["z"])
-                        
-                        # Trim history if it gets too long
-                        if len(self.position_history[hand]["x"]) > self.max_history:
-                            self.position_history[hand]["x"] = self.position_history[hand]["x"][-self.max_history:]
-                            self.position_history[hand]["y"] = self.position_history[hand]["y"][-self.max_history:]
-                            self.position_history[hand]["z"] = self.position_history[hand]["z"][-self.max_history:]
+            # Parse binary or JSON data
+            if len(data) == PACKET.size and data[:2] == PACKET_MAGIC:
+                self.latest_data = unpack_packet(data)
+            else:
+                self.latest_data = json_loads(data)
+        except json.JSONDecodeError:
+            print("Received invalid data")
+            return False
+        
+        # Update position history
+        for hand in ["left", "right"]:
+            if hand in self.latest_data and self.latest_data[hand].get("tracked", False):
+                pos = self.latest_data[hand]["position"]
                 
-                return True
-            except json.JSONDecodeError:
-                print(f"Received invalid data from {addr}")
-        except BlockingIOError:
-            # No data available
-            pass
+                # Store new position in the ring buffer
+                head = self.pos_head[hand]
+                buf = self.pos_buf[hand]
+                buf[head] = buf[head + self.max_history] = (pos["x"], pos["y"], pos["z"])
+                self.pos_head[hand] = (head + 1) % self.max_history
+                if self.pos_count[hand] < self.max_history:
+                    self.pos_count[hand] += 1
         
-        return False
+        return True
     
     def get_latest_data(self):
         """Return the latest controller data"""
         return self.latest_data
     
     def get_position_history(self):
-        """Return the position history for both controllers"""
-        return self.position_history
+        """Return the position history for both controllers as (N, 3) array views, oldest first"""
+        history = {}
+        for hand in ["left", "right"]:
+            end = self.pos_head[hand] + self.max_history
+            history[hand] = self.pos_buf[hand][end - self.pos_count[hand]:end]
+        return history
     
     def close(self):
         """Close the socket"""
@@ -87,55 +153,76 @@ class ViveDataReceiver:
 
 def text_mode(receiver):
     """Run in text-only mode, printing controller data to the console"""
+    # Poll every tick_period seconds measured from the previous deadline
+    tick_period = 0.05
+    next_tick = time.monotonic()
+    
     try:
         while True:
             if receiver.update():
                 data = receiver.get_latest_data()
                 
-                # Clear terminal
-                print("\033c", end="")
+                # Collect the frame's output
+                out = []
                 
                 # Print header
-                print(f"=== HTC Vive Controller Data ===")
-                print(f"Time: {time.strftime('%H:%M:%S')}")
-                print("-------------------------------")
+                out.append(f"=== HTC Vive Controller Data ===")
+                out.append(f"Time: {time.strftime('%H:%M:%S')}")
+                out.append("-------------------------------")
                 
                 # Display controller data
                 for hand in ["left", "right"]:
                     if hand in data:
                         controller = data[hand]
                         if controller.get("tracked", False):
-                            print(f"\n{hand.upper()} CONTROLLER:")
+                            out.append(f"\n{hand.upper()} CONTROLLER:")
                             
                             # Position
                             pos = controller.get("position", {})
                             if pos:
-                                print(f"  Position: X={pos.get('x', 0):.4f}, Y={pos.get('y', 0):.4f}, Z={pos.get('z', 0):.4f}")
+                                out.append(f"  Position: X={pos.get('x', 0):.4f}, Y={pos.get('y', 0):.4f}, Z={pos.get('z', 0):.4f}")
                             
                             # Main buttons
                             buttons = controller.get("buttons", {})
                             if buttons:
-                                print("\n  MAIN BUTTONS:")
+                                out.append("\n  MAIN BUTTONS:")
                                 for btn in ["trigger", "grip", "menu", "system"]:
                                     if btn in buttons:
                                         if isinstance(buttons[btn], dict):
                                             status = "PRESSED" if buttons[btn].get("pressed", False) else "---"
                                         else:
                                             status = "PRESSED" if buttons[btn] else "---"
-                                        print(f"    {btn.capitalize()}: {status}")
+                                        out.append(f"    {btn.capitalize()}: {status}")
                         else:
-                            print(f"\n{hand.upper()} CONTROLLER: Not tracked")
+                            out.append(f"\n{hand.upper()} CONTROLLER: Not tracked")
+                
+                # Clear terminal and write the whole frame at once
+                sys.stdout.write("\033c" + "\n".join(out) + "\n")
+                sys.stdout.flush()
             
-            # Sleep to avoid high CPU usage
-            time.sleep(0.05)
+            # Sleep until the next tick to avoid high CPU usage
+            next_tick += tick_period
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                # Running behind; start the schedule again from now
+                next_tick = time.monotonic()
     except KeyboardInterrupt:
         print("\nExiting...")
 
 def plot_mode(receiver):
-    """Run in plot mode, visualizing controller positions"""
-    if not MATPLOTLIB_AVAILABLE:
-        print("Matplotlib is required for plot mode.")
-        return
+    """Run in plot mode, visualizing controller positions.
+    
+    Returns False without plotting if matplotlib is not available.
+    """
+    try:
+        # Matplotlib is only imported here so text mode starts quickly without it
+        import matplotlib.pyplot as plt
+        from matplotlib.animation import FuncAnimation
+    except ImportError:
+        print("Matplotlib not available. Running in text-only mode.")
+        return False
     
     # Set up the figure and 3D axis
     fig = plt.figure(figsize=(10, 8))
@@ -155,6 +242,7 @@ def plot_mode(receiver):
     ax.set_xlim(-1, 1)
     ax.set_ylim(-1, 1)
     ax.set_zlim(0, 2)
+    ax.set_autoscale_on(False)  # Limits are fixed, so skip autoscaling on every redraw
     
     # Add a legend
     ax.legend()
@@ -165,18 +253,20 @@ def plot_mode(receiver):
         history = receiver.get_position_history()
         
         # Update left controller
-        if history["left"]["x"]:
-            left_trail.set_data(history["left"]["x"], history["left"]["z"])
-            left_trail.set_3d_properties(history["left"]["y"])
-            left_point.set_data([history["left"]["x"][-1]], [history["left"]["z"][-1]])
-            left_point.set_3d_properties([history["left"]["y"][-1]])
+        left = history["left"]
+        if len(left):
+            left_trail.set_data(left[:, 0], left[:, 2])
+            left_trail.set_3d_properties(left[:, 1])
+            left_point.set_data(left[-1:, 0], left[-1:, 2])
+            left_point.set_3d_properties(left[-1:, 1])
         
         # Update right controller
-        if history["right"]["x"]:
-            right_trail.set_data(history["right"]["x"], history["right"]["z"])
-            right_trail.set_3d_properties(history["right"]["y"])
-            right_point.set_data([history["right"]["x"][-1]], [history["right"]["z"][-1]])
-            right_point.set_3d_properties([history["right"]["y"][-1]])
+        right = history["right"]
+        if len(right):
+            right_trail.set_data(right[:, 0], right[:, 2])
+            right_trail.set_3d_properties(right[:, 1])
+            right_point.set_data(right[-1:, 0], right[-1:, 2])
+            right_point.set_3d_properties(right[-1:, 1])
         
         return left_trail, right_trail, left_point, right_point
     
@@ -185,6 +275,7 @@ def plot_mode(receiver):
     
     # Show the plot
     plt.show()
+    return True
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Custom receiver for HTC Vive controller data")
@@ -197,10 +288,9 @@ if __name__ == "__main__":
     receiver = ViveDataReceiver(args.port)
     
     try:
-        # Run in the selected mode
-        if args.mode == "plot" and MATPLOTLIB_AVAILABLE:
-            plot_mode(receiver)
-        else:
+        # Run in the selected mode (plot mode falls back to text mode without matplotlib)
+        matplotlib_available = args.mode == "plot" and plot_mode(receiver)
+        if not matplotlib_available:
             text_mode(receiver)
     finally:
         receiver.close() 
\ No newline at end of file
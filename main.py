@@ -1,26 +1,74 @@
 import openvr
 import time
 import sys
+import os
 import math
 import numpy as np
 import socket
 import json
+import struct
+import ctypes
 import argparse
+import threading
+import collections
+
+try:
+    # Numba compiles the per-frame math to native code when it is installed
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    # orjson serializes straight to bytes and is much faster than the stdlib encoder
+    import orjson
+
+    def encode_json(data):
+        """Serialize controller data to JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def encode_json(data):
+        """Serialize controller data to JSON bytes"""
+        return json.dumps(data).encode()
+
+try:
+    # Optional, only needed for --wire msgpack
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Fixed-layout binary packet used with --wire binary. After the magic and the
+# timestamp, each hand (left, then right) contributes: tracked flag, position
+# (x, y, z), rotation (roll, pitch, yaw), raw pressed/touched button masks,
+# trigger value and trackpad (x, y).
+PACKET_MAGIC = b"VV"
+PACKET = struct.Struct("<2sd" + "B3f3fQQ3f" * 2)
+EMPTY_HAND = (0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 0, 0.0, 0.0, 0.0)
 
 def get_pose_matrix(pose):
-    """Convert OpenVR pose to a 4x4 numpy matrix"""
-    return np.array([
-        [pose.mDeviceToAbsoluteTracking[0][0], pose.mDeviceToAbsoluteTracking[0][1], pose.mDeviceToAbsoluteTracking[0][2], pose.mDeviceToAbsoluteTracking[0][3]],
-        [pose.mDeviceToAbsoluteTracking[1][0], pose.mDeviceToAbsoluteTracking[1][1], pose.mDeviceToAbsoluteTracking[1][2], pose.mDeviceToAbsoluteTracking[1][3]],
-        [pose.mDeviceToAbsoluteTracking[2][0], pose.mDeviceToAbsoluteTracking[2][1], pose.mDeviceToAbsoluteTracking[2][2], pose.mDeviceToAbsoluteTracking[2][3]],
-        [0.0, 0.0, 0.0, 1.0]
-    ])
+    """Return the OpenVR 3x4 device-to-absolute matrix in the form euler_from_34 expects.
+    
+    With Numba this is a zero-copy numpy view for the compiled function. Without it,
+    the raw ctypes matrix is returned, since building an array just to read six
+    values from it in Python costs more than indexing the matrix directly.
+    """
+    if not NUMBA_AVAILABLE:
+        return pose.mDeviceToAbsoluteTracking
+    matrix = (ctypes.c_float * 12).from_address(ctypes.addressof(pose.mDeviceToAbsoluteTracking))
+    return np.frombuffer(matrix, dtype=np.float32).reshape(3, 4)
 
-def extract_rotation_euler(matrix):
-    """Extract Euler angles (in degrees) from a rotation matrix"""
+@njit("UniTuple(float64, 3)(float32[:, ::1])", cache=True, fastmath=True)
+def euler_from_34(matrix):
+    """Extract Euler angles (in degrees) from a 3x4 pose matrix"""
     # Convert rotation matrix to Euler angles (roll, pitch, yaw)
     # This is a simplified version and might not handle all edge cases
-    pitch = math.atan2(-matrix[2][0], math.sqrt(matrix[0][0]**2 + matrix[1][0]**2))
+    pitch = math.atan2(-matrix[2][0], math.sqrt(matrix[0][0] ** 2 + matrix[1][0] ** 2))
     yaw = math.atan2(matrix[1][0], matrix[0][0])
     roll = math.atan2(matrix[2][1], matrix[2][2])
     
@@ -46,6 +94,45 @@ def get_button_names():
         openvr.k_EButton_SteamVR_Trigger: "Trigger"
     }
 
+# (button ID, display name, data key) for every button, computed once
+BUTTON_TABLE = [(button_id, button_name, button_name.lower().replace(" ", "_"))
+                for button_id, button_name in get_button_names().items()]
+
+# Button IDs in the same order as BUTTON_TABLE, for decode_buttons
+BUTTON_IDS = np.array([button_id for button_id, _, _ in BUTTON_TABLE], dtype=np.uint8)
+
+@njit(cache=True)
+def decode_buttons(pressed, touched, ids, out):
+    """Decode the pressed/touched bit of each button ID into out[i, 0] and out[i, 1]"""
+    one = np.uint64(1)
+    for i in range(ids.size):
+        out[i, 0] = (pressed >> ids[i]) & one
+        out[i, 1] = (touched >> ids[i]) & one
+
+def create_hand_data(all_buttons=False):
+    """Create the data dictionary for one controller, reused and updated in place every frame"""
+    buttons = {
+        "system": False,
+        "menu": False,
+        "grip": False,
+        "trigger": False,
+        "trackpad": {"pressed": False, "touched": False}
+    }
+    hand_data = {
+        "tracked": False,
+        "position": {"x": 0.0, "y": 0.0, "z": 0.0},
+        "rotation": {"roll": 0.0, "pitch": 0.0, "yaw": 0.0},
+        "buttons": buttons,
+        "analog": {"trigger": 0.0, "trackpad": {"x": 0.0, "y": 0.0}},
+        "raw_buttons": {"pressed": 0, "touched": 0}
+    }
+    if all_buttons:
+        # Pressed/touched state of every button, kept apart from the main bool buttons
+        # above since the table reuses their names (system, menu, grip, trigger)
+        hand_data["buttons_all"] = {button_key: {"pressed": False, "touched": False}
+                                    for _, _, button_key in BUTTON_TABLE}
+    return hand_data
+
 def find_controllers(vr_system):
     """Find and identify the controllers"""
     controllers = {"left": None, "right": None}
@@ -62,7 +149,318 @@ def find_controllers(vr_system):
     
     return controllers
 
-def get_controller_info(target_ip=None, target_port=None):
+class UdpSender:
+    def __init__(self, udp_socket, address, max_queued=4):
+        """Send packets from a background thread so the tracking loop never waits on the network"""
+        self.sock = udp_socket
+        self.address = address
+        
+        # Packets waiting to be sent; the oldest is discarded when the queue is full
+        self._queue = collections.deque(maxlen=max_queued)
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        
+        # Send statistics, read by the tracking loop for display. Each counter is only
+        # written by one thread: evictions by the caller, full send buffers by the sender.
+        self._evicted = 0
+        self._send_dropped = 0
+        self.last_error = None
+        
+        self._thread = threading.Thread(target=self._sender_loop)
+        self._thread.daemon = True
+        self._thread.start()
+    
+    @property
+    def dropped(self):
+        """Packets discarded because the queue or the socket send buffer was full"""
+        return self._evicted + self._send_dropped
+    
+    def send(self, payload):
+        """Queue a packet for sending"""
+        if len(self._queue) == self._queue.maxlen:
+            # append() below silently discards the oldest packet
+            self._evicted += 1
+        self._queue.append(payload)
+        self._ready.set()
+    
+    def _sender_loop(self):
+        """Send queued packets until closed"""
+        while not self._stop.is_set():
+            self._ready.wait()
+            self._ready.clear()
+            
+            while self._queue:
+                payload = self._queue.popleft()
+                try:
+                    self.sock.sendto(payload, self.address)
+                    self.last_error = None
+                except BlockingIOError:
+                    # Send buffer is full; drop this packet rather than wait
+                    self._send_dropped += 1
+                except Exception as e:
+                    self.last_error = e
+    
+    def close(self):
+        """Stop the sender thread"""
+        self._stop.set()
+        self._ready.set()
+        self._thread.join(timeout=1.0)
+
+def make_tick(vr_system, controllers, udp_sender, wire, verbose):
+    """Build the function that runs one tracking frame.
+    
+    Everything fixed for the session (buffers, the send path, the header lines) is
+    set up here once, so the returned closure only does per-frame work.
+    """
+    # Pose array filled in place by OpenVR each tick
+    poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+    
+    # Scratch array for the controller axes (x, y per axis)
+    axis_values = np.zeros(2 * openvr.k_unControllerStateAxisCount, dtype=np.float32)
+    
+    # Scratch array for decoded (pressed, touched) button states
+    button_states = np.zeros((len(BUTTON_IDS), 2), dtype=np.uint8)
+    
+    # Controller data for network transmission, updated in place every frame
+    controller_data = {"left": create_hand_data(verbose), "right": create_hand_data(verbose), "timestamp": 0.0}
+    
+    # Flat per-hand values for the binary packet, updated every frame
+    packet_fields = {"left": EMPTY_HAND, "right": EMPTY_HAND}
+    
+    # Time tracking for controller reconnection
+    last_controller_check = time.time()
+    controller_check_interval = 2.0  # Check for controllers every 2 seconds
+    
+    # Select the verbose button decoding for this configuration
+    if verbose:
+        def decode_all_buttons(state, hand_data, out):
+            """Method 2: Loop through all buttons (alternative approach)"""
+            buttons_all = hand_data["buttons_all"]
+            out.append("\n  ALL BUTTONS:")
+            decode_buttons(np.uint64(state.ulButtonPressed), np.uint64(state.ulButtonTouched),
+                           BUTTON_IDS, button_states)
+            for i, (button_id, button_name, button_key) in enumerate(BUTTON_TABLE):
+                is_pressed = bool(button_states[i, 0])
+                is_touched = bool(button_states[i, 1])
+            
+                status = "PRESSED" if is_pressed else ("TOUCHED" if is_touched else "---")
+                out.append(f"    {button_name}: {status}")
+            
+                # Store button state for network transmission
+                button_state = buttons_all[button_key]
+                button_state["pressed"] = is_pressed
+                button_state["touched"] = is_touched
+    else:
+        def decode_all_buttons(state, hand_data, out):
+            """Only the main buttons are reported without --verbose"""
+    
+    # Select the send path for this configuration
+    header = []
+    if not udp_sender:
+        def send(out):
+            """No target configured; nothing to send"""
+    else:
+        target_ip, target_port = udp_sender.address
+        header.append(f"Sending data to: {target_ip}:{target_port}")
+        
+        if wire == "binary":
+            # Reusable buffer for binary packets
+            packet_buf = bytearray(PACKET.size)
+            
+            def send_packet():
+                """Pack into the fixed-layout packet and hand a copy to the sender thread"""
+                PACKET.pack_into(packet_buf, 0, PACKET_MAGIC, controller_data["timestamp"],
+                                 *packet_fields["left"], *packet_fields["right"])
+                udp_sender.send(bytes(packet_buf))
+        elif wire == "msgpack":
+            def send_packet():
+                """Convert data to MessagePack and send"""
+                udp_sender.send(msgpack.packb(controller_data))
+        else:
+            def send_packet():
+                """Convert data to JSON and send"""
+                udp_sender.send(encode_json(controller_data))
+        
+        def send(out):
+            """Send this frame's controller data and report the result"""
+            try:
+                # Add timestamp to the data
+                controller_data["timestamp"] = time.time()
+                send_packet()
+                out.append(f"\nData sent to {target_ip}:{target_port} (dropped: {udp_sender.dropped})")
+            except Exception as e:
+                out.append(f"\nError sending data: {e}")
+            
+            if udp_sender.last_error:
+                out.append(f"Last send error: {udp_sender.last_error}")
+    header.append("-----------------------------------")
+    
+    def tick():
+        """Read both controllers, print their state and send it"""
+        nonlocal last_controller_check
+        
+        # Collect this frame's output and write it in one go at the end
+        out = []
+        
+        # Periodically check for controllers (to handle sleep/wake cycles)
+        current_time = time.time()
+        if current_time - last_controller_check > controller_check_interval:
+            new_controllers = find_controllers(vr_system)
+            
+            # Update controller indices if new ones are found
+            if controllers["left"] is None and new_controllers["left"] is not None:
+                controllers["left"] = new_controllers["left"]
+                out.append("Left controller reconnected!")
+            
+            if controllers["right"] is None and new_controllers["right"] is not None:
+                controllers["right"] = new_controllers["right"]
+                out.append("Right controller reconnected!")
+            
+            last_controller_check = current_time
+        
+        out.append("\n=== HTC Vive Controller Tracker ===")
+        out.append(f"Time: {time.strftime('%H:%M:%S')}")
+        out.extend(header)
+        
+        # Reset the flat per-hand values for the binary packet
+        packet_fields["left"] = packet_fields["right"] = EMPTY_HAND
+        
+        # Get the poses of all devices once for both controllers
+        vr_system.getDeviceToAbsoluteTrackingPose(openvr.TrackingUniverseStanding, 0, poses)
+        
+        # Get controller data
+        for hand, device_idx in controllers.items():
+            hand_data = controller_data[hand]
+            hand_data["tracked"] = False
+            
+            if device_idx is not None:
+                # Get the device pose
+                pose = poses[device_idx]
+                
+                if pose.bPoseIsValid:
+                    # Get position
+                    pos_x = pose.mDeviceToAbsoluteTracking[0][3]
+                    pos_y = pose.mDeviceToAbsoluteTracking[1][3]
+                    pos_z = pose.mDeviceToAbsoluteTracking[2][3]
+                    
+                    # Get rotation
+                    matrix = get_pose_matrix(pose)
+                    roll, pitch, yaw = euler_from_34(matrix)
+                    
+                    # Get controller state (buttons, etc.)
+                    result, state = vr_system.getControllerState(device_idx)
+                    
+                    # Store data for network transmission
+                    hand_data["tracked"] = True
+                    position = hand_data["position"]
+                    position["x"] = pos_x
+                    position["y"] = pos_y
+                    position["z"] = pos_z
+                    rotation = hand_data["rotation"]
+                    rotation["roll"] = roll
+                    rotation["pitch"] = pitch
+                    rotation["yaw"] = yaw
+                    
+                    # Print controller info
+                    out.append(f"\n{hand.upper()} CONTROLLER:")
+                    out.append(f"  Position: X={pos_x:.4f}, Y={pos_y:.4f}, Z={pos_z:.4f} (meters)")
+                    out.append(f"  Rotation: Roll={roll:.1f}°, Pitch={pitch:.1f}°, Yaw={yaw:.1f}°")
+                    
+                    # Display button states
+                    if result:
+                        out.append("\n  BUTTON STATES:")
+                        
+                        # Display raw button values for debugging
+                        out.append(f"    Raw Button Pressed: {state.ulButtonPressed}")
+                        out.append(f"    Raw Button Touched: {state.ulButtonTouched}")
+                        
+                        # Store raw button states for network transmission
+                        hand_data["raw_buttons"]["pressed"] = state.ulButtonPressed
+                        hand_data["raw_buttons"]["touched"] = state.ulButtonTouched
+                        buttons = hand_data["buttons"]
+                        
+                        # Method 1: Check specific buttons directly
+                        out.append("\n  MAIN BUTTONS:")
+                        
+                        # System button (typically the power button)
+                        system_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_System)) != 0
+                        out.append(f"    System Button: {'PRESSED' if system_pressed else '---'}")
+                        buttons["system"] = system_pressed
+                        
+                        # Menu button
+                        menu_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_ApplicationMenu)) != 0
+                        out.append(f"    Menu Button: {'PRESSED' if menu_pressed else '---'}")
+                        buttons["menu"] = menu_pressed
+                        
+                        # Grip button
+                        grip_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_Grip)) != 0
+                        out.append(f"    Grip Button: {'PRESSED' if grip_pressed else '---'}")
+                        buttons["grip"] = grip_pressed
+                        
+                        # Trigger button
+                        trigger_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_SteamVR_Trigger)) != 0
+                        out.append(f"    Trigger Button: {'PRESSED' if trigger_pressed else '---'}")
+                        buttons["trigger"] = trigger_pressed
+                        
+                        # Trackpad touch
+                        trackpad_touched = (state.ulButtonTouched & (1 << openvr.k_EButton_SteamVR_Touchpad)) != 0
+                        trackpad_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_SteamVR_Touchpad)) != 0
+                        trackpad_status = "PRESSED" if trackpad_pressed else ("TOUCHED" if trackpad_touched else "---")
+                        out.append(f"    Trackpad: {trackpad_status}")
+                        buttons["trackpad"]["pressed"] = trackpad_pressed
+                        buttons["trackpad"]["touched"] = trackpad_touched
+                        
+                        # All buttons (verbose only)
+                        decode_all_buttons(state, hand_data, out)
+                        
+                        # Display analog inputs
+                        out.append("\n  ANALOG INPUTS:")
+                        # Copy all axes (x, y pairs) out of the ctypes state in one go
+                        ctypes.memmove(axis_values.ctypes.data, ctypes.addressof(state.rAxis), axis_values.nbytes)
+                        
+                        # Trigger
+                        trigger_value = float(axis_values[2])
+                        out.append(f"    Trigger: {trigger_value:.2f}")
+                        hand_data["analog"]["trigger"] = trigger_value
+                        
+                        # Trackpad/Thumbstick
+                        trackpad_x = float(axis_values[0])
+                        trackpad_y = float(axis_values[1])
+                        out.append(f"    Trackpad: X={trackpad_x:.2f}, Y={trackpad_y:.2f}")
+                        hand_data["analog"]["trackpad"]["x"] = trackpad_x
+                        hand_data["analog"]["trackpad"]["y"] = trackpad_y
+                        
+                        packet_fields[hand] = (
+                            1, pos_x, pos_y, pos_z, roll, pitch, yaw,
+                            state.ulButtonPressed, state.ulButtonTouched,
+                            trigger_value, trackpad_x, trackpad_y
+                        )
+                    else:
+                        packet_fields[hand] = (1, pos_x, pos_y, pos_z, roll, pitch, yaw) + EMPTY_HAND[7:]
+                    
+                    # Check if controller is being tracked
+                    out.append(f"\n  Tracking: {'OK' if pose.bDeviceIsConnected else 'Not Connected'}")
+                else:
+                    out.append(f"\n{hand.upper()} CONTROLLER: Not tracked")
+                    # If the controller is not tracked, check if it's still connected
+                    if not pose.bDeviceIsConnected:
+                        # Controller might be disconnected or asleep, mark for rediscovery
+                        controllers[hand] = None
+                        out.append(f"  {hand.upper()} controller disconnected or asleep. Will try to reconnect.")
+            else:
+                out.append(f"\n{hand.upper()} CONTROLLER: Not detected")
+        
+        # Send controller data over UDP (no-op without a target)
+        send(out)
+        
+        out.append("\nPress Ctrl+C to exit.")
+        # Clear previous output and write the frame
+        sys.stdout.write("\033c" + "\n".join(out) + "\n")
+        sys.stdout.flush()
+        
+    return tick
+
+def get_controller_info(target_ip=None, target_port=None, wire="json", verbose=False):
     """Initialize OpenVR and get information about the HTC Vive controllers."""
     try:
         # Initialize OpenVR
@@ -70,9 +468,14 @@ def get_controller_info(target_ip=None, target_port=None):
         
         # Set up UDP socket if target IP and port are provided
         udp_socket = None
+        udp_sender = None
         if target_ip and target_port:
             udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            print(f"\nSending controller data to {target_ip}:{target_port}")
+            # Larger send buffer and non-blocking sends so a busy network never stalls tracking
+            udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            udp_socket.setblocking(False)
+            udp_sender = UdpSender(udp_socket, (target_ip, target_port))
+            print(f"\nSending controller data to {target_ip}:{target_port} ({wire})")
         
         print("\n=== HTC Vive Controller Tracker ===")
         print("Press Ctrl+C to exit.")
@@ -81,9 +484,6 @@ def get_controller_info(target_ip=None, target_port=None):
         # Get the tracking system
         vr_system = openvr.VRSystem()
         
-        # Get button names
-        button_names = get_button_names()
-        
         # Dictionary to store controller indices
         controllers = find_controllers(vr_system)
         
@@ -91,199 +491,25 @@ def get_controller_info(target_ip=None, target_port=None):
               f"Right: {'Yes' if controllers['right'] is not None else 'No'}")
         print("-----------------------------------")
         
-        # Time tracking for controller reconnection
-        last_controller_check = time.time()
-        controller_check_interval = 2.0  # Check for controllers every 2 seconds
+        # Per-frame work for this configuration
+        tick = make_tick(vr_system, controllers, udp_sender, wire, verbose)
+        
+        # Tick scheduling: run every tick_period seconds measured from the previous deadline
+        tick_period = 0.1
+        next_tick = time.monotonic()
         
         try:
             while True:
-                # Clear previous output (Windows)
-                if sys.platform == 'win32':
-                    _ = system('cls')
-                else:
-                    _ = system('clear')
-                
-                # Periodically check for controllers (to handle sleep/wake cycles)
-                current_time = time.time()
-                if current_time - last_controller_check > controller_check_interval:
-                    new_controllers = find_controllers(vr_system)
-                    
-                    # Update controller indices if new ones are found
-                    if controllers["left"] is None and new_controllers["left"] is not None:
-                        controllers["left"] = new_controllers["left"]
-                        print("Left controller reconnected!")
-                    
-                    if controllers["right"] is None and new_controllers["right"] is not None:
-                        controllers["right"] = new_controllers["right"]
-                        print("Right controller reconnected!")
-                    
-                    last_controller_check = current_time
-                
-                print("\n=== HTC Vive Controller Tracker ===")
-                print(f"Time: {time.strftime('%H:%M:%S')}")
-                if target_ip and target_port:
-                    print(f"Sending data to: {target_ip}:{target_port}")
-                print("-----------------------------------")
+                tick()
                 
-                # Dictionary to store all controller data for network transmission
-                controller_data = {}
-                
-                # Get controller data
-                for hand, device_idx in controllers.items():
-                    if device_idx is not None:
-                        # Get the device pose
-                        poses = vr_system.getDeviceToAbsoluteTrackingPose(
-                            openvr.TrackingUniverseStanding, 0, openvr.k_unMaxTrackedDeviceCount)
-                        pose = poses[device_idx]
-                        
-                        # Initialize data dictionary for this controller
-                        controller_data[hand] = {
-                            "tracked": False,
-                            "position": {},
-                            "rotation": {},
-                            "buttons": {},
-                            "analog": {}
-                        }
-                        
-                        if pose.bPoseIsValid:
-                            # Get position
-                            pos_x = pose.mDeviceToAbsoluteTracking[0][3]
-                            pos_y = pose.mDeviceToAbsoluteTracking[1][3]
-                            pos_z = pose.mDeviceToAbsoluteTracking[2][3]
-                            
-                            # Get rotation
-                            matrix = get_pose_matrix(pose)
-                            roll, pitch, yaw = extract_rotation_euler(matrix)
-                            
-                            # Get controller state (buttons, etc.)
-                            result, state = vr_system.getControllerState(device_idx)
-                            
-                            # Store data for network transmission
-                            controller_data[hand]["tracked"] = True
-                            controller_data[hand]["position"] = {"x": pos_x, "y": pos_y, "z": pos_z}
-                            controller_data[hand]["rotation"] = {"roll": roll, "pitch": pitch, "yaw": yaw}
-                            
-                            # Print controller info
-                            print(f"\n{hand.upper()} CONTROLLER:")
-                            print(f"  Position: X={pos_x:.4f}, Y={pos_y:.4f}, Z={pos_z:.4f} (meters)")
-                            print(f"  Rotation: Roll={roll:.1f}°, Pitch={pitch:.1f}°, Yaw={yaw:.1f}°")
-                            
-                            # Display button states
-                            if result:
-                                print("\n  BUTTON STATES:")
-                                
-                                # Display raw button values for debugging
-                                print(f"    Raw Button Pressed: {state.ulButtonPressed}")
-                                print(f"    Raw Button Touched: {state.ulButtonTouched}")
-                                
-                                # Store raw button states for network transmission
-                                controller_data[hand]["raw_buttons"] = {
-                                    "pressed": state.ulButtonPressed,
-                                    "touched": state.ulButtonTouched
-                                }
-                                
-                                # Method 1: Check specific buttons directly
-                                print("\n  MAIN BUTTONS:")
-                                
-                                # System button (typically the power button)
-                                system_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_System)) != 0
-                                print(f"    System Button: {'PRESSED' if system_pressed else '---'}")
-                                controller_data[hand]["buttons"]["system"] = system_pressed
-                                
-                                # Menu button
-                                menu_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_ApplicationMenu)) != 0
-                                print(f"    Menu Button: {'PRESSED' if menu_pressed else '---'}")
-                                controller_data[hand]["buttons"]["menu"] = menu_pressed
-                                
-                                # Grip button
-                                grip_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_Grip)) != 0
-                                print(f"    Grip Button: {'PRESSED' if grip_pressed else '---'}")
-                                controller_data[hand]["buttons"]["grip"] = grip_pressed
-                                
-                                # Trigger button
-                                trigger_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_SteamVR_Trigger)) != 0
-                                print(f"    Trigger Button: {'PRESSED' if trigger_pressed else '---'}")
-                                controller_data[hand]["buttons"]["trigger"] = trigger_pressed
-                                
-                                # Trackpad touch
-                                trackpad_touched = (state.ulButtonTouched & (1 << openvr.k_EButton_SteamVR_Touchpad)) != 0
-                                trackpad_pressed = (state.ulButtonPressed & (1 << openvr.k_EButton_SteamVR_Touchpad)) != 0
-                                trackpad_status = "PRESSED" if trackpad_pressed else ("TOUCHED" if trackpad_touched else "---")
-                                print(f"    Trackpad: {trackpad_status}")
-                                controller_data[hand]["buttons"]["trackpad"] = {
-                                    "pressed": trackpad_pressed,
-                                    "touched": trackpad_touched
-                                }
-                                
-                                # Method 2: Loop through all buttons (alternative approach)
-                                print("\n  ALL BUTTONS:")
-                                for button_id, button_name in button_names.items():
-                                    try:
-                                        # Check if the button is pressed
-                                        is_pressed = (state.ulButtonPressed & (1 << button_id)) != 0
-                                        # Check if the button is touched
-                                        is_touched = (state.ulButtonTouched & (1 << button_id)) != 0
-                                        
-                                        status = "PRESSED" if is_pressed else ("TOUCHED" if is_touched else "---")
-                                        print(f"    {button_name}: {status}")
-                                        
-                                        # Store button state for network transmission
-                                        button_key = button_name.lower().replace(" ", "_")
-                                        controller_data[hand]["buttons"][button_key] = {
-                                            "pressed": is_pressed,
-                                            "touched": is_touched
-                                        }
-                                    except Exception as e:
-                                        print(f"    Error checking {button_name}: {e}")
-                                
-                                # Display analog inputs
-                                print("\n  ANALOG INPUTS:")
-                                # Trigger
-                                trigger_value = state.rAxis[1].x if len(state.rAxis) > 1 else 0.0
-                                print(f"    Trigger: {trigger_value:.2f}")
-                                controller_data[hand]["analog"]["trigger"] = trigger_value
-                                
-                                # Trackpad/Thumbstick
-                                if len(state.rAxis) > 0:
-                                    trackpad_x = state.rAxis[0].x
-                                    trackpad_y = state.rAxis[0].y
-                                    print(f"    Trackpad: X={trackpad_x:.2f}, Y={trackpad_y:.2f}")
-                                    controller_data[hand]["analog"]["trackpad"] = {
-                                        "x": trackpad_x,
-                                        "y": trackpad_y
-                                    }
-                                else:
-                                    print("    Trackpad: Not available")
-                            
-                            # Check if controller is being tracked
-                            print(f"\n  Tracking: {'OK' if pose.bDeviceIsConnected else 'Not Connected'}")
-                        else:
-                            print(f"\n{hand.upper()} CONTROLLER: Not tracked")
-                            # If the controller is not tracked, check if it's still connected
-                            if not pose.bDeviceIsConnected:
-                                # Controller might be disconnected or asleep, mark for rediscovery
-                                controllers[hand] = None
-                                print(f"  {hand.upper()} controller disconnected or asleep. Will try to reconnect.")
-                    else:
-                        print(f"\n{hand.upper()} CONTROLLER: Not detected")
-                
-                # Send controller data over UDP if socket is configured
-                if udp_socket and target_ip and target_port:
-                    try:
-                        # Add timestamp to the data
-                        controller_data["timestamp"] = time.time()
-                        
-                        # Convert data to JSON and send
-                        json_data = json.dumps(controller_data)
-                        udp_socket.sendto(json_data.encode(), (target_ip, target_port))
-                        print(f"\nData sent to {target_ip}:{target_port}")
-                    except Exception as e:
-                        print(f"\nError sending data: {e}")
-                
-                print("\nPress Ctrl+C to exit.")
-                
-                # Sleep to avoid flooding the console and network
-                time.sleep(0.1)
+                # Sleep until the next tick to avoid flooding the console and network
+                next_tick += tick_period
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                else:
+                    # Running behind; start the schedule again from now
+                    next_tick = time.monotonic()
                 
         except KeyboardInterrupt:
             print("\nExiting...")
@@ -294,7 +520,9 @@ def get_controller_info(target_ip=None, target_port=None):
         traceback.print_exc()
         
     finally:
-        # Close socket if it was opened
+        # Stop the sender thread and close the socket if they were started
+        if udp_sender:
+            udp_sender.close()
         if udp_socket:
             udp_socket.close()
         
@@ -407,8 +635,8 @@ def display_full(data):
                 if rot:
                     print(f"  Rotation: Roll={rot.get('roll', 0):.1f}°, Pitch={rot.get('pitch', 0):.1f}°, Yaw={rot.get('yaw', 0):.1f}°")
                 
-                # All buttons
-                buttons = controller.get("buttons", {})
+                # All buttons (every button under buttons_all when the sender runs with --verbose)
+                buttons = controller.get("buttons_all") or controller.get("buttons", {})
                 if buttons:
                     print("\\n  ALL BUTTONS:")
                     for btn_name, btn_state in buttons.items():
@@ -455,12 +683,22 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Track and send HTC Vive controller data")
     parser.add_argument("--ip", type=str, default='127.0.0.1', help="IP address of the target machine (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=5555, help="UDP port on the target machine (default: 5555)")
+    parser.add_argument("--wire", choices=["json", "binary", "msgpack"], default="json",
+                        help="Packet format: json, fixed-layout binary or msgpack (default: json)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show and send the state of every button, not just the main ones")
     parser.add_argument("--create-receiver", action="store_true", help="Create a receiver script for the Linux machine")
     args = parser.parse_args()
     
+    if args.wire == "msgpack" and msgpack is None:
+        print("msgpack is not installed. Please install it with:")
+        print("pip install msgpack")
+        sys.exit(1)
+    
     if args.create_receiver:
         create_receiver_script()
     else:
-        # Import system for clearing the screen
-        from os import system
-        get_controller_info(args.ip, args.port)
\ No newline at end of file
+        # Enable ANSI escape sequences (used to clear the screen) in the Windows console
+        if sys.platform == 'win32':
+            os.system('')
+        get_controller_info(args.ip, args.port, args.wire, args.verbose)
\ No newline at end of file
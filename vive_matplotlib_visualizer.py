@@ -7,66 +7,180 @@ It also changes the color of the controller representation when the trigger is p
 """
 
 import socket
+import asyncio
 import json
 import time
+import math
 import numpy as np
 import threading
 import argparse
 import sys
 import os
-from collections import deque
+import ctypes
+import ctypes.util
+import errno
+import operator
 from datetime import datetime
 
+try:
+    # orjson parses bytes directly and is much faster than the stdlib decoder
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 try:
     import matplotlib.pyplot as plt
-    from matplotlib.animation import FuncAnimation
     from mpl_toolkits.mplot3d import Axes3D
-    from matplotlib.patches import FancyArrowPatch
-    from mpl_toolkits.mplot3d import proj3d
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.lines import Line2D
 except ImportError:
     print("Matplotlib is not installed. Please install it with:")
     print("pip install matplotlib")
     sys.exit(1)
 
-# Class for 3D arrows (for coordinate frames)
-class Arrow3D(FancyArrowPatch):
-    def __init__(self, xs, ys, zs, *args, **kwargs):
-        super().__init__((0, 0), (0, 0), *args, **kwargs)
-        self._verts3d = xs, ys, zs
+# recvmmsg(2) structures, used to drain several datagrams per system call on Linux
+class iovec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t)
+    ]
+
+class msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int)
+    ]
+
+class mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", msghdr),
+        ("msg_len", ctypes.c_uint)
+    ]
+
+class sockaddr_in(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),  # Network byte order
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8)
+    ]
 
-    def do_3d_projection(self, renderer=None):
-        xs3d, ys3d, zs3d = self._verts3d
-        xs, ys, zs = proj3d.proj_transform(xs3d, ys3d, zs3d, self.axes.M)
-        self.set_positions((xs[0], ys[0]), (xs[1], ys[1]))
-        return np.min(zs)
+_recvmmsg = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(mmsghdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _recvmmsg = None
+
+RECVMMSG_AVAILABLE = _recvmmsg is not None
+
+@njit("void(float64, float64, float64, float64[:, ::1])", cache=True, fastmath=True)
+def _euler_to_R(roll, pitch, yaw, out):
+    """Write R = Rz(yaw) @ Ry(pitch) @ Rx(roll) for angles in degrees into out"""
+    roll = math.radians(roll)
+    pitch = math.radians(pitch)
+    yaw = math.radians(yaw)
+    
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    
+    # Closed-form product
+    out[0, 0] = cy * cp
+    out[0, 1] = cy * sp * sr - sy * cr
+    out[0, 2] = cy * sp * cr + sy * sr
+    out[1, 0] = sy * cp
+    out[1, 1] = sy * sp * sr + cy * cr
+    out[1, 2] = sy * sp * cr - cy * sr
+    out[2, 0] = -sp
+    out[2, 1] = cp * sr
+    out[2, 2] = cp * cr
+
+# Field getters for the fixed packet layout (one C call per sub-dict)
+_pos_get = operator.itemgetter("x", "y", "z")
+_rot_get = operator.itemgetter("roll", "pitch", "yaw")
+
+class ControllerState:
+    def __init__(self, name, color, max_trail_points):
+        """Latest state, motion trail and plot artists of one controller"""
+        self.name = name
+        self.color = color  # Plot color when the trigger is not pressed
+        self.rgba = None  # color as an RGBA array, set in run_visualization
+        
+        self.tracked = False
+        self.trigger_pressed = False
+        self.position = np.array([0.0, 0.0, 0.0])
+        self.rotation = np.array([0.0, 0.0, 0.0])  # Euler angles in degrees
+        self.buttons = {}
+        
+        # Trail points (history of positions) in a ring buffer. Every sample is
+        # written twice, max_trail_points rows apart, so the trail is always one
+        # contiguous slice and never needs to be copied or reordered.
+        self.max_trail_points = max_trail_points
+        self.trail = np.empty((2 * max_trail_points, 3), dtype=np.float32)
+        self.trail_idx = 0  # Next write index
+        self.trail_count = 0  # Number of valid samples
+        
+        # Plot artists and this controller's rows of the shared marker/frame arrays,
+        # created in run_visualization
+        self.trail_line = None
+        self.marker_position = None
+        self.marker_color = None
+        self.frame_segments = None
+        
+        # Scaled coordinate frame axes and the (roll, pitch, yaw, scale) they were computed for
+        self.frame_cache_key = None
+        self.frame_cache_axes = None
+    
+    def add_trail_point(self, position):
+        """Append a position to the trail ring buffer"""
+        idx = self.trail_idx
+        self.trail[idx] = self.trail[idx + self.max_trail_points] = position
+        self.trail_idx = (idx + 1) % self.max_trail_points
+        if self.trail_count < self.max_trail_points:
+            self.trail_count += 1
+    
+    def get_trail(self):
+        """Return the trail, oldest point first, as an (N, 3) view into the ring buffer"""
+        end = self.trail_idx + self.max_trail_points
+        return self.trail[end - self.trail_count:end]
 
 class ViveControllerVisualizer:
     def __init__(self, port=5555, max_trail_points=50, axis_limit=2.0, terminal_output=True):
         """Initialize the visualizer with the specified port"""
         self.port = port
-        self.socket_lock = threading.Lock()  # Add lock for thread safety
         
         # Initialize data storage
         self.latest_data = None
         self.running = True
-        self.left_trigger_pressed = False
-        self.right_trigger_pressed = False
-        
-        # Controller positions
-        self.left_position = np.array([0.0, 0.0, 0.0])
-        self.right_position = np.array([0.0, 0.0, 0.0])
-        
-        # Controller rotations (Euler angles in degrees)
-        self.left_rotation = np.array([0.0, 0.0, 0.0])
-        self.right_rotation = np.array([0.0, 0.0, 0.0])
         
-        # Controller button states
-        self.left_buttons = {}
-        self.right_buttons = {}
-        
-        # Controller tracking status
-        self.left_tracked = False
-        self.right_tracked = False
+        # Controller states
+        self.max_trail_points = max_trail_points
+        self.controllers = {
+            "left": ControllerState("left", 'blue', max_trail_points),
+            "right": ControllerState("right", 'red', max_trail_points)
+        }
         
         # Last update time
         self.last_update_time = time.time()
@@ -74,45 +188,55 @@ class ViveControllerVisualizer:
         # Terminal output flag
         self.terminal_output = terminal_output
         self.terminal_update_interval = 0.2  # seconds
-        self.last_terminal_update = 0
+        self._new_data = None  # asyncio.Event set by the receiver, created on the loop thread
         
-        # Trail points (history of positions)
-        self.max_trail_points = max_trail_points
-        self.left_trail_x = deque(maxlen=max_trail_points)
-        self.left_trail_y = deque(maxlen=max_trail_points)
-        self.left_trail_z = deque(maxlen=max_trail_points)
-        self.right_trail_x = deque(maxlen=max_trail_points)
-        self.right_trail_y = deque(maxlen=max_trail_points)
-        self.right_trail_z = deque(maxlen=max_trail_points)
+        # Plot redraw state
+        self._plot_new_data = threading.Event()  # Set by the receiver after each packet
+        self.last_plot_redraw = 0
+        self.idle_redraw_interval = 1.0  # seconds between redraws when no data arrives
         
         # Axis limits
         self.axis_limit = axis_limit
+        self.current_limits = None  # Limits currently applied to the plot
+        
+        # Scratch rotation matrix reused by euler_to_rotation_matrix
+        self._R_buf = np.empty((3, 3))
         
         # Position history for auto-scaling
-        self.min_x, self.max_x = 0, 0
-        self.min_y, self.max_y = 0, 0
-        self.min_z, self.max_z = 0, 0
+        self.aabb_min = np.full(3, np.inf)
+        self.aabb_max = np.full(3, -np.inf)
         self.auto_scale = True
         
-        # Socket error flag
+        # Kernel receive buffer size requested for the UDP socket
+        self.rcvbuf_size = 2 * 1024 * 1024
+        
+        # Socket error flag and count of consecutive receive errors
         self.socket_error = False
+        self.consecutive_errors = 0
+        self.max_consecutive_errors = 5
         
         # Debug mode
         self.debug_mode = True  # Set to True to enable debug output
+        self.debug_dump_interval = 0.5  # seconds between full data structure dumps
+        self.last_debug_dump = 0
         
-        # Initialize socket
-        self.initialize_socket()
+        # Batched receive buffers (Linux only; other platforms use recvfrom)
+        self.batch_receive = RECVMMSG_AVAILABLE
+        if self.batch_receive:
+            self.init_batch_buffers()
         
-        # Start the receiver thread
-        self.receiver_thread = threading.Thread(target=self.receive_data)
-        self.receiver_thread.daemon = True
-        self.receiver_thread.start()
+        # Event loop that runs the receiver and the terminal output in one background thread.
+        # A selector loop explicitly: the Windows default (Proactor) has no add_reader.
+        self.loop = asyncio.SelectorEventLoop()
         
-        # Start terminal output thread if enabled
-        if self.terminal_output:
-            self.terminal_thread = threading.Thread(target=self.update_terminal)
-            self.terminal_thread.daemon = True
-            self.terminal_thread.start()
+        # Initialize socket (registers it with the loop)
+        self.sock = None
+        self.initialize_socket()
+        
+        # Start the loop thread
+        self.loop_thread = threading.Thread(target=self.run_loop)
+        self.loop_thread.daemon = True
+        self.loop_thread.start()
         
         print(f"Listening for controller data on port {port}...")
         print(f"Initial axis limit set to ±{axis_limit} meters")
@@ -121,41 +245,121 @@ class ViveControllerVisualizer:
         print("Press 'd' to toggle debug mode")
         print("Use arrow keys to rotate the view")
     
+    def run_loop(self):
+        """Run the event loop (receiver and terminal output) until cleanup stops it"""
+        asyncio.set_event_loop(self.loop)
+        self._new_data = asyncio.Event()
+        if self.terminal_output:
+            self.loop.create_task(self.update_terminal())
+        self.loop.run_forever()
+    
+    def stop_loop(self):
+        """Close the socket, cancel the terminal task and stop the loop (runs on the loop thread)"""
+        self.close_socket()
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self.loop.call_soon(self.loop.stop)
+    
+    def close_socket(self):
+        """Unregister and close the UDP socket"""
+        if self.sock:
+            try:
+                self.loop.remove_reader(self.sock.fileno())
+                self.sock.close()
+            except:
+                pass
+            self.sock = None
+    
     def initialize_socket(self):
         """Initialize the UDP socket"""
-        with self.socket_lock:
-            try:
-                if hasattr(self, 'sock') and self.sock:
-                    try:
-                        self.sock.close()
-                    except:
-                        pass
-                
-                self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                # Set socket options for reuse
-                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                # Bind to all interfaces
-                self.sock.bind(("0.0.0.0", self.port))
-                self.sock.settimeout(0.1)  # Set a timeout for non-blocking operation
-                self.socket_error = False
-                print(f"Socket initialized on port {self.port}")
-            except Exception as e:
-                print(f"Error initializing socket: {e}")
-                self.socket_error = True
+        # The socket is owned by the loop thread: once the loop runs, this is only called there
+        # (other threads schedule it with call_soon_threadsafe), so no lock is needed
+        self.close_socket()
+        try:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Set socket options for reuse
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Larger receive buffer so packets queue up instead of dropping while a redraw stalls us
+            self.set_receive_buffer(self.rcvbuf_size)
+            # Bind to all interfaces
+            self.sock.bind(("0.0.0.0", self.port))
+            # Non-blocking socket; the loop's selector (epoll/kqueue) calls us when data is ready
+            self.sock.setblocking(False)
+            self.loop.add_reader(self.sock.fileno(), self.on_udp_ready)
+            self.socket_error = False
+            self.consecutive_errors = 0
+            print(f"Socket initialized on port {self.port}")
+        except Exception as e:
+            print(f"Error initializing socket: {e}")
+            self.socket_error = True
+            self.close_socket()
+            # Try again shortly
+            self.loop.call_later(1, self.initialize_socket)
+    
+    def set_receive_buffer(self, size):
+        """Request a kernel receive buffer of size bytes and report if the OS capped it"""
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            actual = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if actual < size and hasattr(socket, "SO_RCVBUFFORCE"):
+                # Linux caps SO_RCVBUF at net.core.rmem_max; SO_RCVBUFFORCE bypasses it with CAP_NET_ADMIN
+                try:
+                    self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUFFORCE, size)
+                    actual = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+                except OSError:
+                    pass
+            if actual < size:
+                print(f"Receive buffer is {actual} bytes (requested {size}); raise net.core.rmem_max for more")
+        except OSError as e:
+            print(f"Could not set receive buffer size: {e}")
+    
+    def init_batch_buffers(self, count=16, size=4096):
+        """Preallocate the buffers and message headers used by recvmmsg"""
+        self._batch_count = count
+        self._batch_bufs = (ctypes.c_char * size * count)()
+        self._batch_addrs = (sockaddr_in * count)()
+        self._batch_iov = (iovec * count)()
+        self._batch_msgs = (mmsghdr * count)()
+        for i in range(count):
+            self._batch_iov[i].iov_base = ctypes.addressof(self._batch_bufs[i])
+            self._batch_iov[i].iov_len = size
+            hdr = self._batch_msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._batch_addrs[i])
+            hdr.msg_namelen = ctypes.sizeof(sockaddr_in)
+            hdr.msg_iov = ctypes.pointer(self._batch_iov[i])
+            hdr.msg_iovlen = 1
+    
+    def recv_batch(self):
+        """Receive up to the batch size of pending datagrams in one system call"""
+        n = _recvmmsg(self.sock.fileno(), self._batch_msgs, self._batch_count, socket.MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+        
+        packets = []
+        for i in range(n):
+            sa = self._batch_addrs[i]
+            addr = (socket.inet_ntoa(bytes(sa.sin_addr)), socket.ntohs(sa.sin_port))
+            data = ctypes.string_at(self._batch_iov[i].iov_base, self._batch_msgs[i].msg_len)
+            packets.append((data, addr))
+        return packets
     
     def clear_terminal(self):
         """Clear the terminal screen"""
-        if sys.platform == 'win32':
-            os.system('cls')
-        else:
-            os.system('clear')
+        # ANSI cursor-home + clear-screen, no subprocess needed
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
     
-    def update_terminal(self):
+    async def update_terminal(self):
         """Update the terminal with controller information"""
         while self.running:
-            if self.terminal_output and time.time() - self.last_terminal_update > self.terminal_update_interval:
-                self.last_terminal_update = time.time()
-                
+            # Sleep until the receiver has new data
+            await self._new_data.wait()
+            self._new_data.clear()
+            
+            if self.terminal_output:
                 # Clear the terminal
                 self.clear_terminal()
                 
@@ -166,49 +370,27 @@ class ViveControllerVisualizer:
                 print(f"Data Last Updated: {time.time() - self.last_update_time:.1f} seconds ago")
                 print("=" * 50)
                 
-                # Left controller
-                print("\nLEFT CONTROLLER:")
-                if self.left_tracked:
-                    print(f"  Status: TRACKED")
-                    print(f"  Position: X={self.left_position[0]:.4f}, Y={self.left_position[1]:.4f}, Z={self.left_position[2]:.4f} m")
-                    print(f"  Rotation: Roll={self.left_rotation[0]:.1f}°, Pitch={self.left_rotation[1]:.1f}°, Yaw={self.left_rotation[2]:.1f}°")
-                    
-                    # Button states
-                    print("\n  BUTTON STATES:")
-                    trigger_status = "PRESSED" if self.left_trigger_pressed else "RELEASED"
-                    print(f"    Trigger: {trigger_status}")
-                    
-                    for button, state in self.left_buttons.items():
-                        if button != "trigger":  # Already displayed trigger
-                            if isinstance(state, dict):
-                                status = "PRESSED" if state.get("pressed", False) else ("TOUCHED" if state.get("touched", False) else "---")
-                            else:
-                                status = "PRESSED" if state else "---"
-                            print(f"    {button.capitalize()}: {status}")
-                else:
-                    print("  Status: NOT TRACKED")
-                
-                # Right controller
-                print("\nRIGHT CONTROLLER:")
-                if self.right_tracked:
-                    print(f"  Status: TRACKED")
-                    print(f"  Position: X={self.right_position[0]:.4f}, Y={self.right_position[1]:.4f}, Z={self.right_position[2]:.4f} m")
-                    print(f"  Rotation: Roll={self.right_rotation[0]:.1f}°, Pitch={self.right_rotation[1]:.1f}°, Yaw={self.right_rotation[2]:.1f}°")
-                    
-                    # Button states
-                    print("\n  BUTTON STATES:")
-                    trigger_status = "PRESSED" if self.right_trigger_pressed else "RELEASED"
-                    print(f"    Trigger: {trigger_status}")
-                    
-                    for button, state in self.right_buttons.items():
-                        if button != "trigger":  # Already displayed trigger
-                            if isinstance(state, dict):
-                                status = "PRESSED" if state.get("pressed", False) else ("TOUCHED" if state.get("touched", False) else "---")
-                            else:
-                                status = "PRESSED" if state else "---"
-                            print(f"    {button.capitalize()}: {status}")
-                else:
-                    print("  Status: NOT TRACKED")
+                for side, st in self.controllers.items():
+                    print(f"\n{side.upper()} CONTROLLER:")
+                    if st.tracked:
+                        print(f"  Status: TRACKED")
+                        print(f"  Position: X={st.position[0]:.4f}, Y={st.position[1]:.4f}, Z={st.position[2]:.4f} m")
+                        print(f"  Rotation: Roll={st.rotation[0]:.1f}°, Pitch={st.rotation[1]:.1f}°, Yaw={st.rotation[2]:.1f}°")
+                        
+                        # Button states
+                        print("\n  BUTTON STATES:")
+                        trigger_status = "PRESSED" if st.trigger_pressed else "RELEASED"
+                        print(f"    Trigger: {trigger_status}")
+                        
+                        for button, state in st.buttons.items():
+                            if button != "trigger":  # Already displayed trigger
+                                if isinstance(state, dict):
+                                    status = "PRESSED" if state.get("pressed", False) else ("TOUCHED" if state.get("touched", False) else "---")
+                                else:
+                                    status = "PRESSED" if state else "---"
+                                print(f"    {button.capitalize()}: {status}")
+                    else:
+                        print("  Status: NOT TRACKED")
                 
                 # Controls reminder
                 print("\n" + "=" * 50)
@@ -219,69 +401,66 @@ class ViveControllerVisualizer:
                 print("  Arrow keys - Rotate view")
                 print("  Press Ctrl+C to exit")
             
-            # Sleep to avoid high CPU usage
-            time.sleep(0.1)
+            # Limit the refresh rate
+            await asyncio.sleep(self.terminal_update_interval)
     
-    def receive_data(self):
-        """Receive data from the UDP socket in a separate thread"""
-        consecutive_errors = 0
-        max_consecutive_errors = 5
-        
-        while self.running:
-            if self.socket_error:
-                print("Socket error detected, attempting to reinitialize...")
-                self.initialize_socket()
-                time.sleep(1)  # Wait before trying again
-                continue
-                
-            try:
-                # Try to receive data with the lock
-                with self.socket_lock:
-                    if not self.sock:
-                        raise Exception("Socket is not initialized")
-                    data, addr = self.sock.recvfrom(4096)
-                
-                consecutive_errors = 0  # Reset error counter on success
+    def on_udp_ready(self):
+        """Loop reader callback: drain every pending datagram from the UDP socket"""
+        try:
+            while True:
+                if not self.sock:
+                    return
+                if self.batch_receive:
+                    packets = self.recv_batch()
+                else:
+                    try:
+                        packets = [self.sock.recvfrom(4096)]
+                    except BlockingIOError:
+                        packets = []
+                if not packets:
+                    break
                 
-                try:
-                    # Parse JSON data
-                    json_data = data.decode('utf-8')
-                    self.latest_data = json.loads(json_data)
-                    
-                    if self.debug_mode:
-                        print(f"Received data from {addr[0]}:{addr[1]}, size: {len(data)} bytes")
-                        
-                        # Debug: Print tracked status
-                        if "left" in self.latest_data:
-                            left_tracked = self.latest_data["left"].get("tracked", False)
-                            print(f"Left controller tracked: {left_tracked}")
-                        if "right" in self.latest_data:
-                            right_tracked = self.latest_data["right"].get("tracked", False)
-                            print(f"Right controller tracked: {right_tracked}")
-                    
-                    # Update controller positions and states
-                    self.update_controller_data()
+                self.consecutive_errors = 0  # Reset error counter on success
+                for data, addr in packets:
+                    self.handle_packet(data, addr)
                     
-                    # Update last update time
-                    self.last_update_time = time.time()
-                    
-                except json.JSONDecodeError as e:
-                    print(f"Received invalid JSON data: {e}")
-                    if self.debug_mode:
-                        print(f"Raw data: {data[:100]}...")  # Print first 100 chars for debugging
-                        
-            except socket.timeout:
-                # No data available, just continue
-                pass
-            except Exception as e:
-                consecutive_errors += 1
-                print(f"Socket error ({consecutive_errors}/{max_consecutive_errors}): {e}")
-                if consecutive_errors >= max_consecutive_errors:
-                    print(f"Multiple consecutive errors: {e}")
-                    print("Attempting to reinitialize socket...")
-                    self.socket_error = True
-                    consecutive_errors = 0
-                time.sleep(0.5)  # Wait a bit before retrying
+        except Exception as e:
+            self.consecutive_errors += 1
+            print(f"Socket error ({self.consecutive_errors}/{self.max_consecutive_errors}): {e}")
+            if self.consecutive_errors >= self.max_consecutive_errors:
+                print(f"Multiple consecutive errors: {e}")
+                print("Attempting to reinitialize socket...")
+                self.socket_error = True
+                self.close_socket()
+                self.loop.call_later(1, self.initialize_socket)
+    
+    def handle_packet(self, data, addr):
+        """Parse one datagram and update the controller state"""
+        try:
+            # Parse JSON data
+            self.latest_data = json_loads(data)
+            
+            if self.debug_mode:
+                print(f"Received data from {addr[0]}:{addr[1]}, size: {len(data)} bytes")
+                
+                # Debug: Print tracked status
+                for side in self.controllers:
+                    if side in self.latest_data:
+                        tracked = self.latest_data[side].get("tracked", False)
+                        print(f"{side.capitalize()} controller tracked: {tracked}")
+            
+            # Update controller positions and states
+            self.update_controller_data()
+            
+            # Update last update time
+            self.last_update_time = time.time()
+            self._new_data.set()  # Called on the loop thread
+            self._plot_new_data.set()
+            
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"Received invalid JSON data: {e}")
+            if self.debug_mode:
+                print(f"Raw data: {data[:100]}...")  # Print first 100 chars for debugging
     
     def update_controller_data(self):
         """Update controller positions and states from the latest data"""
@@ -289,271 +468,203 @@ class ViveControllerVisualizer:
             return
         
         if self.debug_mode:
-            # Debug: Print the entire data structure
-            print(f"Latest data structure: {json.dumps(self.latest_data, indent=2)[:200]}...")
-        
-        # Update left controller
-        if "left" in self.latest_data:
+            # Debug: Print the start of the data structure, at most a couple of times per second
+            now = time.time()
+            if now - self.last_debug_dump >= self.debug_dump_interval:
+                self.last_debug_dump = now
+                text = repr(self.latest_data)
+                print("Latest data structure:", text if len(text) <= 200 else text[:200] + "...")
+        
+        for side, st in self.controllers.items():
+            src = self.latest_data.get(side)
+            if not src:
+                continue
+            
             # Get tracked status directly from the data
-            self.left_tracked = self.latest_data["left"].get("tracked", False)
+            st.tracked = src.get("tracked", False)
             
             if self.debug_mode:
-                print(f"Setting left_tracked to {self.left_tracked}")
+                print(f"Setting {side} tracked to {st.tracked}")
             
             # Even if not tracked, update button states if available
-            if "buttons" in self.latest_data["left"]:
-                self.left_buttons = self.latest_data["left"]["buttons"]
+            if "buttons" in src:
+                st.buttons = src["buttons"]
                 
                 # Trigger state
-                if "trigger" in self.left_buttons:
-                    if isinstance(self.left_buttons["trigger"], bool):
-                        self.left_trigger_pressed = self.left_buttons["trigger"]
-                    elif isinstance(self.left_buttons["trigger"], dict):
-                        self.left_trigger_pressed = self.left_buttons["trigger"].get("pressed", False)
-                
+                if "trigger" in st.buttons:
+                    trigger = st.buttons["trigger"]
+                    if isinstance(trigger, bool):
+                        st.trigger_pressed = trigger
+                    elif isinstance(trigger, dict):
+                        st.trigger_pressed = trigger.get("pressed", False)
+            
             # Update position and rotation only if tracked
-            if self.left_tracked:
-                # Position
-                if "position" in self.latest_data["left"]:
-                    pos = self.latest_data["left"]["position"]
-                    if all(k in pos for k in ["x", "y", "z"]):
-                        self.left_position = np.array([pos["x"], pos["y"], pos["z"]])
-                        
-                        if self.debug_mode:
-                            print(f"Updated left position: {self.left_position}")
-                        
-                        # Add to trail
-                        self.left_trail_x.append(pos["x"])
-                        self.left_trail_y.append(pos["y"])
-                        self.left_trail_z.append(pos["z"])
-                        
-                        # Update min/max for auto-scaling
-                        self.min_x = min(self.min_x, pos["x"])
-                        self.max_x = max(self.max_x, pos["x"])
-                        self.min_y = min(self.min_y, pos["y"])
-                        self.max_y = max(self.max_y, pos["y"])
-                        self.min_z = min(self.min_z, pos["z"])
-                        self.max_z = max(self.max_z, pos["z"])
-                
-                # Rotation
-                if "rotation" in self.latest_data["left"]:
-                    rot = self.latest_data["left"]["rotation"]
-                    if all(k in rot for k in ["roll", "pitch", "yaw"]):
-                        self.left_rotation = np.array([rot["roll"], rot["pitch"], rot["yaw"]])
-                
-                # Alternative way to check trigger
-                if "analog" in self.latest_data["left"] and "trigger" in self.latest_data["left"]["analog"]:
-                    self.left_trigger_pressed = self.latest_data["left"]["analog"]["trigger"] > 0.5
-        
-        # Update right controller
-        if "right" in self.latest_data:
-            # Get tracked status directly from the data
-            self.right_tracked = self.latest_data["right"].get("tracked", False)
+            if not st.tracked:
+                continue
             
-            if self.debug_mode:
-                print(f"Setting right_tracked to {self.right_tracked}")
+            # Position
+            pos = src.get("position")
+            if pos is not None:
+                try:
+                    xyz = _pos_get(pos)
+                except KeyError:
+                    pass
+                else:
+                    pos_arr = np.array(xyz)
+                    st.position = pos_arr
+                    
+                    if self.debug_mode:
+                        print(f"Updated {side} position: {st.position}")
+                    
+                    # Add to trail
+                    st.add_trail_point(pos_arr)
+                    
+                    # Update min/max for auto-scaling
+                    np.minimum(self.aabb_min, pos_arr, out=self.aabb_min)
+                    np.maximum(self.aabb_max, pos_arr, out=self.aabb_max)
             
-            # Even if not tracked, update button states if available
-            if "buttons" in self.latest_data["right"]:
-                self.right_buttons = self.latest_data["right"]["buttons"]
-                
-                # Trigger state
-                if "trigger" in self.right_buttons:
-                    if isinstance(self.right_buttons["trigger"], bool):
-                        self.right_trigger_pressed = self.right_buttons["trigger"]
-                    elif isinstance(self.right_buttons["trigger"], dict):
-                        self.right_trigger_pressed = self.right_buttons["trigger"].get("pressed", False)
+            # Rotation
+            rot = src.get("rotation")
+            if rot is not None:
+                try:
+                    st.rotation = np.array(_rot_get(rot))
+                except KeyError:
+                    pass
             
-            # Update position and rotation only if tracked
-            if self.right_tracked:
-                # Position
-                if "position" in self.latest_data["right"]:
-                    pos = self.latest_data["right"]["position"]
-                    if all(k in pos for k in ["x", "y", "z"]):
-                        self.right_position = np.array([pos["x"], pos["y"], pos["z"]])
-                        
-                        if self.debug_mode:
-                            print(f"Updated right position: {self.right_position}")
-                        
-                        # Add to trail
-                        self.right_trail_x.append(pos["x"])
-                        self.right_trail_y.append(pos["y"])
-                        self.right_trail_z.append(pos["z"])
-                        
-                        # Update min/max for auto-scaling
-                        self.min_x = min(self.min_x, pos["x"])
-                        self.max_x = max(self.max_x, pos["x"])
-                        self.min_y = min(self.min_y, pos["y"])
-                        self.max_y = max(self.max_y, pos["y"])
-                        self.min_z = min(self.min_z, pos["z"])
-                        self.max_z = max(self.max_z, pos["z"])
-                
-                # Rotation
-                if "rotation" in self.latest_data["right"]:
-                    rot = self.latest_data["right"]["rotation"]
-                    if all(k in rot for k in ["roll", "pitch", "yaw"]):
-                        self.right_rotation = np.array([rot["roll"], rot["pitch"], rot["yaw"]])
-                
-                # Alternative way to check trigger
-                if "analog" in self.latest_data["right"] and "trigger" in self.latest_data["right"]["analog"]:
-                    self.right_trigger_pressed = self.latest_data["right"]["analog"]["trigger"] > 0.5
+            # Alternative way to check trigger
+            analog = src.get("analog")
+            if analog and "trigger" in analog:
+                st.trigger_pressed = analog["trigger"] > 0.5
     
     def euler_to_rotation_matrix(self, euler_angles):
-        """Convert Euler angles (in degrees) to rotation matrix"""
-        # Convert to radians
-        roll, pitch, yaw = np.radians(euler_angles)
-        
-        # Roll (rotation around X-axis)
-        R_x = np.array([
-            [1, 0, 0],
-            [0, np.cos(roll), -np.sin(roll)],
-            [0, np.sin(roll), np.cos(roll)]
-        ])
-        
-        # Pitch (rotation around Y-axis)
-        R_y = np.array([
-            [np.cos(pitch), 0, np.sin(pitch)],
-            [0, 1, 0],
-            [-np.sin(pitch), 0, np.cos(pitch)]
-        ])
-        
-        # Yaw (rotation around Z-axis)
-        R_z = np.array([
-            [np.cos(yaw), -np.sin(yaw), 0],
-            [np.sin(yaw), np.cos(yaw), 0],
-            [0, 0, 1]
-        ])
-        
-        # Combined rotation matrix
-        R = np.dot(R_z, np.dot(R_y, R_x))
-        
-        return R
+        """Convert Euler angles (in degrees) to rotation matrix (R = Rz(yaw) @ Ry(pitch) @ Rx(roll))"""
+        # Written into the preallocated buffer (compiled with Numba when available)
+        _euler_to_R(euler_angles[0], euler_angles[1], euler_angles[2], self._R_buf)
+        return self._R_buf
     
-    def create_coordinate_frame(self, ax, position, rotation, scale=0.1):
-        """Create a coordinate frame at the given position with the given rotation"""
-        # Get rotation matrix
-        R = self.euler_to_rotation_matrix(rotation)
-        
-        # Create arrows for each axis
-        x_axis = np.array([scale, 0, 0])
-        y_axis = np.array([0, scale, 0])
-        z_axis = np.array([0, 0, scale])
-        
-        # Apply rotation
-        x_axis = np.dot(R, x_axis)
-        y_axis = np.dot(R, y_axis)
-        z_axis = np.dot(R, z_axis)
-        
-        # Create arrows
-        x_arrow = Arrow3D([position[0], position[0] + x_axis[0]],
-                          [position[1], position[1] + x_axis[1]],
-                          [position[2], position[2] + x_axis[2]],
-                          mutation_scale=10, lw=2, arrowstyle='-|>', color='r')
-        
-        y_arrow = Arrow3D([position[0], position[0] + y_axis[0]],
-                          [position[1], position[1] + y_axis[1]],
-                          [position[2], position[2] + y_axis[2]],
-                          mutation_scale=10, lw=2, arrowstyle='-|>', color='g')
-        
-        z_arrow = Arrow3D([position[0], position[0] + z_axis[0]],
-                          [position[1], position[1] + z_axis[1]],
-                          [position[2], position[2] + z_axis[2]],
-                          mutation_scale=10, lw=2, arrowstyle='-|>', color='b')
-        
-        # Add arrows to the plot
-        ax.add_artist(x_arrow)
-        ax.add_artist(y_arrow)
-        ax.add_artist(z_arrow)
+    def update_coordinate_frame(self, st, scale=0.1):
+        """Write the three axis segments of a controller's coordinate frame into st.frame_segments"""
+        # Recompute the scaled axes only when the rotation changed
+        rotation = st.rotation
+        key = (rotation[0], rotation[1], rotation[2], scale)
+        if key != st.frame_cache_key:
+            # The columns of R are the rotated unit axes; store them as rows
+            R = self.euler_to_rotation_matrix(rotation)
+            st.frame_cache_axes = R.T * scale
+            st.frame_cache_key = key
+        
+        segments = st.frame_segments
+        segments[:, 0] = st.position
+        segments[:, 1] = st.position
+        segments[:, 1] += st.frame_cache_axes
     
-    def update_plot(self, frame, ax, left_controller, right_controller, 
-                   left_trail, right_trail, title_text, info_text):
-        """Update function for the animation"""
-        # Clear the axis for redrawing
-        ax.clear()
-        
-        # Set axis labels and limits
-        ax.set_xlabel('X (meters)')
-        ax.set_ylabel('Z (meters)')  # Swap Y and Z for more intuitive view
-        ax.set_zlabel('Y (meters)')
-        
-        # Set axis limits
-        if self.auto_scale and (self.min_x != self.max_x):
+    def get_axis_limits(self):
+        """Return the plot (x, y, z) limits for the current scaling mode"""
+        mn = self.aabb_min
+        mx = self.aabb_max
+        if self.auto_scale and mx[0] > mn[0]:
             # Add some padding to the limits
             padding = 0.2
-            x_range = max(0.5, self.max_x - self.min_x)
-            y_range = max(0.5, self.max_y - self.min_y)
-            z_range = max(0.5, self.max_z - self.min_z)
+            x_range = max(0.5, mx[0] - mn[0])
+            y_range = max(0.5, mx[1] - mn[1])
+            z_range = max(0.5, mx[2] - mn[2])
             
             # Center the plot on the data
-            x_center = (self.min_x + self.max_x) / 2
-            y_center = (self.min_y + self.max_y) / 2
-            z_center = (self.min_z + self.max_z) / 2
+            x_center = (mn[0] + mx[0]) / 2
+            y_center = (mn[1] + mx[1]) / 2
+            z_center = (mn[2] + mx[2]) / 2
             
-            # Set limits with padding
-            ax.set_xlim(x_center - x_range/2 - padding, x_center + x_range/2 + padding)
-            ax.set_zlim(y_center - y_range/2 - padding, y_center + y_range/2 + padding)
-            ax.set_ylim(z_center - z_range/2 - padding, z_center + z_range/2 + padding)
-        else:
-            # Use fixed limits
-            ax.set_xlim(-self.axis_limit, self.axis_limit)
-            ax.set_ylim(-self.axis_limit, self.axis_limit)
-            ax.set_zlim(0, self.axis_limit * 2)
-        
-        # Set title with controller status
-        left_status = "TRACKED" if self.left_tracked else "NOT TRACKED"
-        right_status = "TRACKED" if self.right_tracked else "NOT TRACKED"
-        if self.left_tracked and self.left_trigger_pressed:
-            left_status += " (TRIGGER PRESSED)"
-        if self.right_tracked and self.right_trigger_pressed:
-            right_status += " (TRIGGER PRESSED)"
-        title_text.set_text(f"HTC Vive Controllers - Left: {left_status}, Right: {right_status}")
-        
-        # Update info text
-        scaling_mode = "AUTO" if self.auto_scale else "FIXED"
-        socket_status = "ERROR" if self.socket_error else "OK"
-        data_age = time.time() - self.last_update_time
-        info_text.set_text(f"Scaling: {scaling_mode} | Socket: {socket_status} | Data Age: {data_age:.1f}s | Debug: {'ON' if self.debug_mode else 'OFF'}")
-        
-        # Draw ground plane grid
-        grid_size = self.axis_limit
-        x = np.linspace(-grid_size, grid_size, 11)
-        z = np.linspace(-grid_size, grid_size, 11)
-        X, Z = np.meshgrid(x, z)
-        Y = np.zeros_like(X)
-        ax.plot_wireframe(X, Z, Y, color='gray', alpha=0.3)
-        
-        # Draw left controller
-        left_color = 'green' if self.left_trigger_pressed else 'blue'
-        if self.left_tracked:
-            ax.scatter(self.left_position[0], self.left_position[2], self.left_position[1], 
-                      color=left_color, s=100, label='Left Controller')
-            
-            # Draw trails
-            if len(self.left_trail_x) > 1:
-                ax.plot(list(self.left_trail_x), list(self.left_trail_z), list(self.left_trail_y), 
-                       'b-', alpha=0.5)
-            
-            # Draw coordinate frames
-            self.create_coordinate_frame(ax, self.left_position, self.left_rotation)
-        
-        # Draw right controller
-        right_color = 'green' if self.right_trigger_pressed else 'red'
-        if self.right_tracked:
-            ax.scatter(self.right_position[0], self.right_position[2], self.right_position[1], 
-                      color=right_color, s=100, label='Right Controller')
-            
-            # Draw trails
-            if len(self.right_trail_x) > 1:
-                ax.plot(list(self.right_trail_x), list(self.right_trail_z), list(self.right_trail_y), 
-                       'r-', alpha=0.5)
-            
-            # Draw coordinate frames
-            self.create_coordinate_frame(ax, self.right_position, self.right_rotation)
+            # Plot axes are (X, Z, Y) of the controller data
+            return ((x_center - x_range/2 - padding, x_center + x_range/2 + padding),
+                    (z_center - z_range/2 - padding, z_center + z_range/2 + padding),
+                    (y_center - y_range/2 - padding, y_center + y_range/2 + padding))
+        
+        # Use fixed limits
+        return ((-self.axis_limit, self.axis_limit),
+                (-self.axis_limit, self.axis_limit),
+                (0, self.axis_limit * 2))
+    
+    def update_axis_limits(self, ax):
+        """Apply the axis limits when they change"""
+        limits = self.get_axis_limits()
+        if limits != self.current_limits:
+            self.current_limits = limits
+            ax.set_xlim(*limits[0])
+            ax.set_ylim(*limits[1])
+            ax.set_zlim(*limits[2])
+    
+    def update_controller_artists(self, st):
+        """Update the persistent artists of one controller"""
+        st.trail_line.set_visible(st.tracked)
+        if not st.tracked:
+            # Hide this controller's marker and coordinate frame segments
+            st.marker_color[3] = 0.0
+            st.frame_segments[:] = np.nan
+            return
         
-        # Add legend
-        ax.legend()
+        # Controller position (Y and Z swapped for a more intuitive view)
+        position = st.position
+        marker = st.marker_position
+        marker[0] = position[0]
+        marker[1] = position[2]
+        marker[2] = position[1]
+        st.marker_color[:] = self.trigger_rgba if st.trigger_pressed else st.rgba
+        
+        # Trail
+        if st.trail_count > 1:
+            trail = st.get_trail()
+            st.trail_line.set_data_3d(trail[:, 0], trail[:, 2], trail[:, 1])
+        
+        # Coordinate frame
+        self.update_coordinate_frame(st)
+    
+    def _maybe_redraw(self):
+        """Timer callback: update the plot and request a redraw when there is new data"""
+        now = time.time()
+        if self._plot_new_data.is_set():
+            self._plot_new_data.clear()
+        elif now - self.last_plot_redraw < self.idle_redraw_interval:
+            # Nothing new; only refresh now and then so the data age keeps counting
+            return
+        self.last_plot_redraw = now
         
-        return ax,
+        self.update_plot()
+        self.fig.canvas.draw_idle()
+    
+    def update_plot(self):
+        """Update the persistent artists from the latest controller state"""
+        self.update_axis_limits(self.ax)
+        
+        # Set title with controller status (only when the status changed)
+        title_key = tuple((st.tracked, st.trigger_pressed) for st in self.controllers.values())
+        if title_key != self._last_title_key:
+            self._last_title_key = title_key
+            statuses = []
+            for side, st in self.controllers.items():
+                status = "TRACKED" if st.tracked else "NOT TRACKED"
+                if st.tracked and st.trigger_pressed:
+                    status += " (TRIGGER PRESSED)"
+                statuses.append(f"{side.capitalize()}: {status}")
+            self.title_text.set_text("HTC Vive Controllers - " + ", ".join(statuses))
+        
+        # Update info text (only when a displayed value changed)
+        data_age = round(time.time() - self.last_update_time, 1)
+        info_key = (self.auto_scale, self.socket_error, data_age, self.debug_mode)
+        if info_key != self._last_info_key:
+            self._last_info_key = info_key
+            scaling_mode = "AUTO" if self.auto_scale else "FIXED"
+            socket_status = "ERROR" if self.socket_error else "OK"
+            self.info_text.set_text(f"Scaling: {scaling_mode} | Socket: {socket_status} | Data Age: {data_age:.1f}s | Debug: {'ON' if self.debug_mode else 'OFF'}")
+        
+        # Update controllers
+        for st in self.controllers.values():
+            self.update_controller_artists(st)
+        
+        # Both markers are drawn as one scatter, both coordinate frames as one collection
+        pts = self.marker_positions
+        self.controller_scatter._offsets3d = (pts[:, 0], pts[:, 1], pts[:, 2])
+        self.controller_scatter.set_facecolors(self.marker_colors)
+        self.frames_lc.set_segments(self.frame_segments)
     
     def on_key_press(self, event):
         """Handle key press events"""
@@ -562,9 +673,9 @@ class ViveControllerVisualizer:
             self.auto_scale = not self.auto_scale
             print(f"Auto-scaling: {'ON' if self.auto_scale else 'OFF'}")
         elif event.key == 'r':
-            # Reinitialize socket
+            # Reinitialize socket (on the loop thread, which owns the reader)
             print("Manually reinitializing socket...")
-            self.socket_error = True
+            self.loop.call_soon_threadsafe(self.initialize_socket)
         elif event.key == 't':
             # Toggle terminal output
             self.terminal_output = not self.terminal_output
@@ -573,35 +684,71 @@ class ViveControllerVisualizer:
             # Toggle debug mode
             self.debug_mode = not self.debug_mode
             print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
+        
+        # Show the new settings on the next timer tick
+        self._plot_new_data.set()
     
     def run_visualization(self):
         """Run the matplotlib visualization"""
         # Create figure and 3D axis
         fig = plt.figure(figsize=(12, 10))
         ax = fig.add_subplot(111, projection='3d')
+        self.fig = fig
+        self.ax = ax
         
-        # Create title text
-        title_text = fig.suptitle("HTC Vive Controllers", fontsize=16)
+        # Set axis labels
+        ax.set_xlabel('X (meters)')
+        ax.set_ylabel('Z (meters)')  # Swap Y and Z for more intuitive view
+        ax.set_zlabel('Y (meters)')
         
-        # Create info text
-        info_text = fig.text(0.02, 0.02, "", fontsize=10)
+        # Create title and info text (on the axes, updated in place)
+        self.title_text = ax.text2D(0.5, 1.0, "HTC Vive Controllers", transform=ax.transAxes,
+                                    ha='center', va='top', fontsize=14)
+        self.info_text = ax.text2D(0.0, 0.0, "", transform=ax.transAxes, fontsize=10)
+        self._last_title_key = None  # Status the title/info text was last built from
+        self._last_info_key = None
         
         # Connect key press event
         fig.canvas.mpl_connect('key_press_event', self.on_key_press)
         
-        # Create empty scatter plots for controllers
-        left_controller = ax.scatter([], [], [], color='blue', s=100)
-        right_controller = ax.scatter([], [], [], color='red', s=100)
-        
-        # Create empty line plots for trails
-        left_trail, = ax.plot([], [], [], 'b-', alpha=0.5)
-        right_trail, = ax.plot([], [], [], 'r-', alpha=0.5)
-        
-        # Set up the animation
-        ani = FuncAnimation(fig, self.update_plot, 
-                           fargs=(ax, left_controller, right_controller, 
-                                 left_trail, right_trail, title_text, info_text),
-                           interval=50, blit=False)
+        # Draw ground plane grid once; it is static (axis_limit never changes at runtime)
+        grid_size = self.axis_limit
+        x = np.linspace(-grid_size, grid_size, 11)
+        X, Z = np.meshgrid(x, x)
+        Y = np.zeros_like(X)
+        self.ground_wire = ax.plot_wireframe(X, Z, Y, color='gray', alpha=0.3)
+        
+        # Coordinate frames of both controllers: segments 0-2 are left, 3-5 are right
+        self.frame_segments = np.full((6, 2, 3), np.nan)
+        self.frames_lc = Line3DCollection(self.frame_segments, colors=['r', 'g', 'b', 'r', 'g', 'b'], linewidths=2)
+        ax.add_collection3d(self.frames_lc)
+        
+        # Markers of both controllers in one scatter: one row of positions and RGBA colors per controller
+        self.trigger_rgba = np.array(to_rgba('green'))
+        self.marker_positions = np.zeros((len(self.controllers), 3))
+        self.marker_colors = np.zeros((len(self.controllers), 4))  # Start hidden (alpha 0)
+        self.controller_scatter = ax.scatter(self.marker_positions[:, 0], self.marker_positions[:, 1],
+                                             self.marker_positions[:, 2], c=self.marker_colors,
+                                             s=100, depthshade=False)
+        
+        # Create controller trails and hand out each controller's rows of the shared arrays
+        legend_handles = []
+        for i, (side, st) in enumerate(self.controllers.items()):
+            st.rgba = np.array(to_rgba(st.color))
+            st.trail_line, = ax.plot([], [], [], '-', color=st.color, alpha=0.5)
+            st.marker_position = self.marker_positions[i]
+            st.marker_color = self.marker_colors[i]
+            st.frame_segments = self.frame_segments[3 * i:3 * i + 3]
+            legend_handles.append(Line2D([], [], linestyle='', marker='o', markersize=10,
+                                         color=st.color, label=f'{side.capitalize()} Controller'))
+        
+        # Add legend once; it is static and never rebuilt in update_plot
+        self._legend = ax.legend(handles=legend_handles)
+        
+        # Redraw from a timer, but only when new data has arrived
+        self.redraw_timer = fig.canvas.new_timer(interval=33)
+        self.redraw_timer.add_callback(self._maybe_redraw)
+        self.redraw_timer.start()
         
         # Show the plot
         plt.show()
@@ -613,16 +760,15 @@ class ViveControllerVisualizer:
         """Clean up resources"""
         print("Cleaning up resources...")
         self.running = False
-        time.sleep(0.2)  # Give threads time to notice the running flag
         
-        # Close socket with lock
-        with self.socket_lock:
-            if hasattr(self, 'sock') and self.sock:
-                try:
-                    self.sock.close()
-                    self.sock = None
-                except:
-                    pass
+        # Close the socket and stop the loop on its own thread
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.stop_loop)
+            self.loop_thread.join(timeout=1.0)
+        else:
+            self.close_socket()
+        if not self.loop.is_running():
+            self.loop.close()
         
         print("Cleanup complete")
 
@@ -634,6 +780,10 @@ def main():
     parser.add_argument("--no-terminal", action="store_true", help="Disable terminal output")
     args = parser.parse_args()
     
+    # Enable ANSI escape sequences (used to clear the screen) in the Windows console
+    if sys.platform == 'win32':
+        os.system('')
+    
     try:
         visualizer = ViveControllerVisualizer(
             args.port, 
@@ -103,8 +103,8 @@ def display_full(data):
                 if rot:
                     print(f"  Rotation: Roll={rot.get('roll', 0):.1f}°, Pitch={rot.get('pitch', 0):.1f}°, Yaw={rot.get('yaw', 0):.1f}°")
                 
-                # All buttons
-                buttons = controller.get("buttons", {})
+                # All buttons (every button under buttons_all when the sender runs with --verbose)
+                buttons = controller.get("buttons_all") or controller.get("buttons", {})
                 if buttons:
                     print("\n  ALL BUTTONS:")
                     for btn_name, btn_state in buttons.items():
@@ -1,204 +1,613 @@
 #!/usr/bin/env python3
 import socket
+import selectors
+import threading
 import open3d as o3d
 import numpy as np
 import json
 import argparse
 import time
+import sys
+import math
+import multiprocessing
+from multiprocessing import shared_memory
 
-mesh_sphere = None
-vis = None
-position_history = []
+try:
+    # orjson parses bytes directly and is much faster than the stdlib decoder
+    import orjson
+    json_loads = orjson.loads
+    
+    def json_pretty(data):
+        """Format data as indented JSON"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def json_loads(data):
+        """Parse a JSON packet (the stdlib decoder does not take memoryviews)"""
+        return json.loads(bytes(data))
+    
+    def json_pretty(data):
+        """Format data as indented JSON"""
+        return json.dumps(data, indent=2)
 
-def receive_controller_data(port=5555, display_mode="simple"):
-    global mesh_sphere, vis, position_history
-    """Receive and display controller data from the Windows machine"""
-    # Create UDP socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.bind(("0.0.0.0", port))
-    print(f"Listening for controller data on port {port}...")
+try:
+    # Numba compiles the rotation math to native code when it is installed
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    # Optional, only needed for --wire msgpack
+    import msgpack
+except ImportError:
+    msgpack = None
+
+HANDS = ("left", "right")
+
+# Largest datagram we accept
+MAX_PACKET = 4096
+
+# Linux socket option that attaches the socket's drop counter to each received datagram
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40 if sys.platform.startswith("linux") else None)
+
+# Maximum terminal / 3D redraws per second; packets in between only update the pending state
+DRAW_RATE = 30
+
+# Bit positions of the digital buttons packed into _BTN
+BTN_SYSTEM = 0
+BTN_MENU = 1
+BTN_GRIP = 2
+BTN_TRIGGER = 3
+BTN_TRACKPAD_PRESSED = 4
+BTN_TRACKPAD_TOUCHED = 5
+# Plain bool buttons: raw name, display name, bit
+_MAIN_BTNS = (("system", "System", BTN_SYSTEM), ("menu", "Menu", BTN_MENU),
+              ("grip", "Grip", BTN_GRIP), ("trigger", "Trigger", BTN_TRIGGER))
+# Marks a button missing from the packet, so one .get() replaces an "in" check plus a lookup
+_SENT = object()
+
+# Latest state of each hand (index 0 = left, 1 = right), filled in place by project()
+_TRK = np.zeros(2, dtype=bool)
+_POS = np.zeros((2, 3))
+_RPY = np.zeros((2, 3))
+_RPY_RAD = np.zeros((2, 3))  # _RPY in radians, converted in place for Open3D
+_BTN = np.zeros(2, dtype=np.uint32)
+_BTN_PRESENT = np.zeros(2, dtype=np.uint32)  # which buttons the packet carried (pressed bit positions)
+_ANALOG = np.zeros((2, 3))  # trigger, trackpad x, trackpad y
+
+def project(cd):
+    """Copy the fields we display from a decoded packet into the state arrays"""
+    for i, hand in enumerate(HANDS):
+        controller = cd.get(hand) or {}
+        _TRK[i] = controller.get("tracked", False)
+        if not _TRK[i]:
+            continue
+        
+        pos = controller.get("position") or {}
+        _POS[i] = (pos.get('x', 0), pos.get('y', 0), pos.get('z', 0))
+        rot = controller.get("rotation") or {}
+        _RPY[i] = (rot.get('roll', 0), rot.get('pitch', 0), rot.get('yaw', 0))
+        
+        buttons = controller.get("buttons") or {}
+        bits = 0
+        present = 0
+        for name, _, bit in _MAIN_BTNS:
+            value = buttons.get(name, _SENT)
+            if value is not _SENT:
+                present |= 1 << bit
+                bits |= bool(value) << bit
+        trackpad = buttons.get("trackpad", _SENT)
+        if trackpad is not _SENT:
+            present |= 1 << BTN_TRACKPAD_PRESSED
+            bits |= (bool(trackpad.get("pressed")) << BTN_TRACKPAD_PRESSED
+                     | bool(trackpad.get("touched")) << BTN_TRACKPAD_TOUCHED)
+        _BTN[i] = bits
+        _BTN_PRESENT[i] = present
+        
+        analog = controller.get("analog") or {}
+        pad = analog.get("trackpad") or {}
+        _ANALOG[i] = (analog.get("trigger", 0), pad.get('x', 0), pad.get('y', 0))
+
+# Shared-memory record each --workers process publishes its newest state into.
+# seq is odd while a write is in progress (seqlock), so readers can detect torn copies.
+SHARED_DTYPE = np.dtype([
+    ("seq", np.uint64),
+    ("ip", np.uint32),
+    ("port", np.uint32),
+    ("trk", np.bool_, 2),
+    ("pos", np.float64, (2, 3)),
+    ("rpy", np.float64, (2, 3)),
+    ("btn", np.uint32, 2),
+    ("present", np.uint32, 2),
+    ("analog", np.float64, (2, 3)),
+])
+
+def publish_state(shared, slot, addr):
+    """Write the current state arrays and sender address into one shared record"""
+    shared["seq"][slot] += 1
+    shared["ip"][slot] = int.from_bytes(socket.inet_aton(addr[0]), "big")
+    shared["port"][slot] = addr[1]
+    shared["trk"][slot] = _TRK
+    shared["pos"][slot] = _POS
+    shared["rpy"][slot] = _RPY
+    shared["btn"][slot] = _BTN
+    shared["present"][slot] = _BTN_PRESENT
+    shared["analog"][slot] = _ANALOG
+    shared["seq"][slot] += 1
+
+def read_shared_state(shared, seen):
+    """Load the newest state published since the last call into the state arrays; return its sender address or None"""
+    addr = None
+    for slot in range(len(shared)):
+        seq = int(shared["seq"][slot])
+        if seq == seen[slot] or seq & 1:
+            continue
+        record = shared[slot].copy()
+        if int(shared["seq"][slot]) != seq:
+            # Overwritten while copying; pick it up on the next call
+            continue
+        seen[slot] = seq
+        _TRK[:] = record["trk"]
+        _POS[:] = record["pos"]
+        _RPY[:] = record["rpy"]
+        _BTN[:] = record["btn"]
+        _BTN_PRESENT[:] = record["present"]
+        _ANALOG[:] = record["analog"]
+        addr = (socket.inet_ntoa(int(record["ip"]).to_bytes(4, "big")), int(record["port"]))
+    return addr
+
+# Compiled eagerly (signature given) so the first packet does not pay for the JIT
+@njit("void(float64[::1], float64[:, ::1])", cache=True, fastmath=True)
+def _rotxyz(r, out):
+    """Write R = Rx(r[0]) @ Ry(r[1]) @ Rz(r[2]) (radians) into out, as Open3D's get_rotation_matrix_from_xyz"""
+    cr, sr = math.cos(r[0]), math.sin(r[0])
+    cp, sp = math.cos(r[1]), math.sin(r[1])
+    cy, sy = math.cos(r[2]), math.sin(r[2])
     
-    if display_mode == "3d":
+    # Closed-form product
+    out[0, 0] = cp * cy
+    out[0, 1] = -cp * sy
+    out[0, 2] = sp
+    out[1, 0] = cr * sy + sr * sp * cy
+    out[1, 1] = cr * cy - sr * sp * sy
+    out[1, 2] = -sr * cp
+    out[2, 0] = sr * sy - cr * sp * cy
+    out[2, 1] = sr * cy + cr * sp * sy
+    out[2, 2] = cr * cp
 
-        """Display 3D position and orientation of the controller"""
-        vis = o3d.visualization.Visualizer()
-        vis.create_window()
-        mesh_sphere = o3d.geometry.TriangleMesh.create_sphere(radius=0.05)
-        mesh_sphere.paint_uniform_color([0.1, 0.1, 0.7])
-        vis.add_geometry(mesh_sphere)
+class Vis3D:
+    def __init__(self):
+        """Create the Open3D window, the controller sphere and the camera once"""
+        self.vis = o3d.visualization.Visualizer()
+        self.vis.create_window()
+        self.mesh_sphere = o3d.geometry.TriangleMesh.create_sphere(radius=0.05)
+        self.mesh_sphere.paint_uniform_color([0.1, 0.1, 0.7])
+        self.vis.add_geometry(self.mesh_sphere)
+        # Rotation matrix buffer reused for every update
+        self.R = np.empty((3, 3))
+        
         # Set initial view to look at the sphere
-        ctr = vis.get_view_control()
-        ctr.set_lookat([0, 0, 0])
-        ctr.set_front([0, 0, -1])
-        ctr.set_up([0, -1, 0])
-        ctr.set_zoom(0.5)
+        self.ctr = self.vis.get_view_control()
+        self.ctr.set_lookat([0, 0, 0])
+        self.ctr.set_front([0, 0, -1])
+        self.ctr.set_up([0, -1, 0])
+        self.ctr.set_zoom(0.5)
+    
+    def update(self):
+        """Move the sphere to the latest controller pose (from project()) and render"""
+        for i in range(len(HANDS)):
+            if _TRK[i]:
+                position = _POS[i]
+                
+                # Set position
+                self.mesh_sphere.translate(position, relative=False)
+                
+                # Set orientation
+                _rotxyz(np.radians(_RPY[i], out=_RPY_RAD[i]), self.R)
+                self.mesh_sphere.rotate(self.R, center=self.mesh_sphere.get_center())
+                
+                # Update camera to track the sphere
+                self.ctr.set_lookat(position)
+                
+                self.vis.update_geometry(self.mesh_sphere)
+        self.poll()
+    
+    def poll(self):
+        """Process window events and redraw"""
+        self.vis.poll_events()
+        self.vis.update_renderer()
+    
+    def close(self):
+        """Close the window"""
+        self.vis.destroy_window()
+
+class PacketReader:
+    def __init__(self, sock, decode):
+        """Reusable buffers for draining the socket and decoding the newest datagram"""
+        self.sock = sock
+        self.decode = decode
+        
+        # Datagrams are received into one reusable buffer
+        self._buf = bytearray(MAX_PACKET)
+        self._view = memoryview(self._buf)
+        # Hands of the last packet, to skip packets where only the sender's timestamp changed
+        self._last_hands = None
+        
+        # With SO_RXQ_OVFL on, datagrams carry the number of packets the kernel dropped
+        # for this socket (queue full); read it from the ancillary data
+        self.track_drops = False
+        self.dropped = 0
+        if SO_RXQ_OVFL is not None and hasattr(sock, "recvmsg_into"):
+            try:
+                self.track_drops = bool(sock.getsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL))
+            except OSError:
+                pass
+        self._ancbufsize = socket.CMSG_SPACE(4) if self.track_drops else 0
+    
+    def read(self):
+        """Drain the socket and return (controller_data, addr) for the newest new datagram, or None"""
+        # Drain the queue and keep only the newest datagram; older poses are stale
+        n = None
+        while True:
+            try:
+                if self.track_drops:
+                    n, ancdata, _, addr = self.sock.recvmsg_into([self._buf], self._ancbufsize)
+                    for level, kind, value in ancdata:
+                        if level == socket.SOL_SOCKET and kind == SO_RXQ_OVFL:
+                            self.dropped = int.from_bytes(value[:4], sys.byteorder)
+                else:
+                    n, addr = self.sock.recvfrom_into(self._buf)
+            except BlockingIOError:
+                break
+        if n is None:
+            return None
+        
+        try:
+            # Parse the packet
+            controller_data = self.decode(self._view[:n])
+        except (json.JSONDecodeError, ValueError):
+            print(f"Received invalid data from {addr}")
+            return None
+        
+        # Nothing changed since the last packet (idle controller): skip redrawing.
+        # main.py stamps every packet, so compare the hands rather than the bytes.
+        if isinstance(controller_data, dict):
+            hands = (controller_data.get("left"), controller_data.get("right"))
+            if hands == self._last_hands:
+                return None
+            self._last_hands = hands
+        return controller_data, addr
+
+class ReceiveThread:
+    def __init__(self, reader):
+        """Run a PacketReader on a background thread so receiving never waits on drawing"""
+        self.reader = reader
+        
+        # Single slot holding the newest packet; ready is set while it is filled
+        self._lock = threading.Lock()
+        self._latest = None
+        self.ready = threading.Event()
+        self._stop = threading.Event()
+        
+        self._thread = threading.Thread(target=self._receive_loop)
+        self._thread.daemon = True
+        self._thread.start()
+    
+    def take(self):
+        """Return the newest packet since the last call, or None"""
+        with self._lock:
+            latest, self._latest = self._latest, None
+            self.ready.clear()
+        return latest
+    
+    def _receive_loop(self):
+        """Receive packets until closed"""
+        sel = selectors.DefaultSelector()
+        sel.register(self.reader.sock, selectors.EVENT_READ)
+        while not self._stop.is_set():
+            if not sel.select(timeout=0.5):
+                continue
+            packet = self.reader.read()
+            if packet is not None:
+                with self._lock:
+                    self._latest = packet
+                    self.ready.set()
+        sel.close()
+    
+    def close(self):
+        """Stop the receive thread"""
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+def open_socket(port, rcvbuf, reuse_port=False):
+    """Create the non-blocking UDP socket bound to port"""
+    if hasattr(socket, "SOCK_NONBLOCK"):
+        # Non-blocking and close-on-exec from the start, without extra fcntl calls
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK | socket.SOCK_CLOEXEC)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Non-blocking, so queued datagrams can be drained without waiting
+        sock.setblocking(False)
+    if SO_RXQ_OVFL is not None:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+        except OSError:
+            pass
+    if reuse_port:
+        # Let several processes bind the port; the kernel spreads senders across them
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    # Large receive buffer so packets queue in the kernel instead of dropping while we render.
+    # Linux doubles the value and caps it at net.core.rmem_max; raise that limit
+    # (e.g. sysctl -w net.core.rmem_max=12582912) if the reported size is smaller than requested.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    sock.bind(("0.0.0.0", port))
+    return sock
+
+def make_decoder(wire):
+    """Packet decoder for the selected wire format"""
+    if wire == "msgpack":
+        def decode(data):
+            """Unpack a MessagePack packet"""
+            return msgpack.unpackb(data, raw=False)
+        return decode
+    return json_loads
 
+def ingest_worker(port, rcvbuf, wire, shm_name, workers, slot):
+    """Extra --workers process: receive on its own SO_REUSEPORT socket and publish into shared memory"""
+    sock = open_socket(port, rcvbuf, reuse_port=True)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared = np.ndarray((workers,), dtype=SHARED_DTYPE, buffer=shm.buf)
+    reader = PacketReader(sock, make_decoder(wire))
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ)
+    parent = multiprocessing.parent_process()
+    try:
+        while True:
+            if not sel.select(timeout=0.5):
+                # Exit on our own if the display process died without stopping us
+                if not parent.is_alive():
+                    break
+                continue
+            packet = reader.read()
+            if packet is not None:
+                controller_data, addr = packet
+                project(controller_data)
+                publish_state(shared, slot, addr)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        del shared
+        shm.close()
+        sel.close()
+        sock.close()
 
+def receive_controller_data(port=5555, display_mode="simple", rcvbuf=4 * 1024 * 1024, wire="json", recv_thread=False, workers=1):
+    """Receive and display controller data from the Windows machine"""
+    sock = open_socket(port, rcvbuf, reuse_port=workers > 1)
+    print(f"Receive buffer: requested {rcvbuf} bytes, got {sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)}")
+    print(f"Listening for controller data on port {port} ({wire})...")
+    decode = make_decoder(wire)
+    # Raw JSON mode echoes the datagram text as received, so it only needs a copy of the bytes
+    echo_raw = display_mode == "raw" and wire == "json"
+    if echo_raw:
+        decode = bytes
+    
+    # Extra receiving processes, each publishing its newest state into its own shared record
+    shm = None
+    shared = None
+    procs = []
+    if workers > 1:
+        shm = shared_memory.SharedMemory(create=True, size=SHARED_DTYPE.itemsize * (workers - 1))
+        shared = np.ndarray((workers - 1,), dtype=SHARED_DTYPE, buffer=shm.buf)
+        shared[:] = np.zeros(1, dtype=SHARED_DTYPE)
+        seen = [0] * (workers - 1)
+        for slot in range(workers - 1):
+            proc = multiprocessing.Process(target=ingest_worker, args=(port, rcvbuf, wire, shm.name, workers - 1, slot))
+            proc.daemon = True
+            proc.start()
+            procs.append(proc)
+        print(f"Receiving with {workers} processes")
+    
+    # Set up the 3D window once; in 3D mode wake up often to keep the window responsive
+    vis3d = None
+    wait_timeout = 0.5
+    if display_mode == "3d":
+        vis3d = Vis3D()
+        wait_timeout = 0.02
+    
+    # Receive either on this thread (waiting with a selector) or on a background thread
+    reader = PacketReader(sock, decode)
+    receiver = None
+    sel = None
+    if recv_thread:
+        receiver = ReceiveThread(reader)
+    else:
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
+    
+    # Newest decoded packet not drawn yet; drawing is capped at DRAW_RATE regardless of packet rate
+    pending = None
+    last_draw = 0.0
+    # Header clock text, only reformatted when the second changes
+    clock_sec = -1
+    clock_str = ""
+    
     try:
         while True:
-            # Receive data
-            data, addr = sock.recvfrom(4096)
+            # Wait for data, or only until the next draw is due if a packet is pending
+            timeout = wait_timeout
+            if pending is not None:
+                timeout = max(0.0, last_draw + 1.0 / DRAW_RATE - time.monotonic())
+            if shared is not None:
+                # Workers are not selectable; check their records at least at the draw rate
+                timeout = min(timeout, 1.0 / DRAW_RATE)
+            if receiver is not None:
+                if receiver.ready.wait(timeout):
+                    pending = receiver.take() or pending
+                elif vis3d:
+                    vis3d.poll()
+            elif sel.select(timeout):
+                pending = reader.read() or pending
+            elif vis3d:
+                vis3d.poll()
             
-            try:
-                # Parse JSON data
-                controller_data = json.loads(data.decode())
-                
-                # Clear terminal
-                print("\033c", end="")
-                
-                # Print header
-                print(f"=== HTC Vive Controller Data ===")
-                print(f"From: {addr[0]}:{addr[1]}")
-                print(f"Time: {time.strftime('%H:%M:%S')}")
-                print("-------------------------------")
-                
-                # Display data based on mode
-                if display_mode == "simple":
-                    display_simple(controller_data)
-                elif display_mode == "full":
-                    display_full(controller_data)
-                elif display_mode == "3d":
-                    display_3d(controller_data)
-                elif display_mode == "raw":
-                    print(json.dumps(controller_data, indent=2))
-                
-            except json.JSONDecodeError:
-                print(f"Received invalid data from {addr}")
+            if shared is not None:
+                # State from a worker is already projected; None marks that
+                shared_addr = read_shared_state(shared, seen)
+                if shared_addr is not None:
+                    pending = (None, shared_addr)
+            
+            if pending is None:
+                continue
+            now = time.monotonic()
+            if now - last_draw < 1.0 / DRAW_RATE:
+                continue
+            last_draw = now
+            controller_data, addr = pending
+            pending = None
+            
+            if controller_data is not None and display_mode != "raw":
+                project(controller_data)
+            
+            sec = int(time.time())
+            if sec != clock_sec:
+                clock_sec = sec
+                clock_str = time.strftime('%H:%M:%S', time.localtime(sec))
+            
+            # Build the whole frame and write it (with the terminal clear) in one go
+            out = ["=== HTC Vive Controller Data ===",
+                   f"From: {addr[0]}:{addr[1]}",
+                   f"Time: {clock_str}"]
+            if reader.track_drops:
+                out.append(f"Dropped by kernel: {reader.dropped}")
+            out.append("-------------------------------")
+            
+            # Display data based on mode
+            if display_mode == "simple":
+                display_simple(out)
+            elif display_mode == "full":
+                display_full(controller_data, out)
+            elif echo_raw:
+                out.append(controller_data.decode(errors="replace"))
+            elif display_mode == "raw":
+                out.append(json_pretty(controller_data))
+            sys.stdout.write("\033c" + "\n".join(out) + "\n")
+            sys.stdout.flush()
             
-            # Update position history every second
             if display_mode == "3d":
-                time.sleep(1)
+                vis3d.update()
             
     except KeyboardInterrupt:
         print("\nExiting...")
     finally:
+        if receiver is not None:
+            receiver.close()
+        if sel is not None:
+            sel.close()
         sock.close()
+        for proc in procs:
+            proc.terminate()
+            proc.join(timeout=1.0)
+        if shm is not None:
+            del shared
+            shm.close()
+            shm.unlink()
+        if vis3d:
+            vis3d.close()
 
-def display_simple(data):
-    """Display simplified controller data"""
-    global mesh_sphere, vis, position_history
+# Line formats for the text displays
+_HAND_FMT = "\n{} CONTROLLER:"
+_UNTRACKED_FMT = "\n{} CONTROLLER: Not tracked"
+_POS_FMT = "  Position: X={:.4f}, Y={:.4f}, Z={:.4f}"
+_ROT_FMT = "  Rotation: Roll={:.1f}°, Pitch={:.1f}°, Yaw={:.1f}°"
+_BTN_FMT = "    {}: {}"
+_VALUE_FMT = "    {}: {:.2f}"
+_AXES_FMT = "    {}: X={:.2f}, Y={:.2f}"
 
-    for hand in ["left", "right"]:
-        if hand in data:
-            controller = data[hand]
-            if controller.get("tracked", False):
-                pos = controller.get("position", {})
-                rot = controller.get("rotation", {})
-                if pos and rot:
-                    # Add position to history
-                    position_history.append([pos.get('x', 0), pos.get('y', 0), pos.get('z', 0)])
-                    
-                    # Create small spheres for each position in history
-                    for position in position_history:
-                        history_sphere = o3d.geometry.TriangleMesh.create_sphere(radius=0.02)
-                        history_sphere.paint_uniform_color([0.7, 0.1, 0.1])
-                        history_sphere.translate(position, relative=False)
-                        vis.add_geometry(history_sphere)
-        if hand in data:
-            controller = data[hand]
-            if controller.get("tracked", False):
-                print(f"\n{hand.upper()} CONTROLLER:")
-                
-                # Position
-                pos = controller.get("position", {})
-                if pos:
-                    print(f"  Position: X={pos.get('x', 0):.4f}, Y={pos.get('y', 0):.4f}, Z={pos.get('z', 0):.4f}")
-                
-                # Main buttons
-                buttons = controller.get("buttons", {})
-                print("\n  MAIN BUTTONS:")
-                for btn in ["system", "menu", "grip", "trigger"]:
-                    if btn in buttons:
-                        status = "PRESSED" if buttons[btn] else "---"
-                        print(f"    {btn.capitalize()}: {status}")
-                
-                # Trackpad
-                if "trackpad" in buttons:
-                    trackpad = buttons["trackpad"]
-                    status = "PRESSED" if trackpad.get("pressed", False) else ("TOUCHED" if trackpad.get("touched", False) else "---")
-                    print(f"    Trackpad: {status}")
-                
-                # Analog inputs
-                analog = controller.get("analog", {})
-                if analog:
-                    print("\n  ANALOG INPUTS:")
-                    if "trigger" in analog:
-                        print(f"    Trigger: {analog['trigger']:.2f}")
-                    if "trackpad" in analog:
-                        trackpad = analog["trackpad"]
-                        print(f"    Trackpad: X={trackpad.get('x', 0):.2f}, Y={trackpad.get('y', 0):.2f}")
-            else:
-                print(f"\n{hand.upper()} CONTROLLER: Not tracked")
-
-def display_full(data):
-    """Display detailed controller data"""
-    for hand in ["left", "right"]:
-        if hand in data:
-            controller = data[hand]
-            if controller.get("tracked", False):
-                print(f"\n{hand.upper()} CONTROLLER:")
-                
-                # Position
-                pos = controller.get("position", {})
-                if pos:
-                    print(f"  Position: X={pos.get('x', 0):.4f}, Y={pos.get('y', 0):.4f}, Z={pos.get('z', 0):.4f}")
-                
-                # Rotation
-                rot = controller.get("rotation", {})
-                if rot:
-                    print(f"  Rotation: Roll={rot.get('roll', 0):.1f}°, Pitch={rot.get('pitch', 0):.1f}°, Yaw={rot.get('yaw', 0):.1f}°")
-                
-                # All buttons
-                buttons = controller.get("buttons", {})
-                if buttons:
-                    print("\n  ALL BUTTONS:")
-                    for btn_name, btn_state in buttons.items():
-                        if isinstance(btn_state, dict):
-                            status = "PRESSED" if btn_state.get("pressed", False) else ("TOUCHED" if btn_state.get("touched", False) else "---")
-                        else:
-                            status = "PRESSED" if btn_state else "---"
-                        print(f"    {btn_name.replace('_', ' ').capitalize()}: {status}")
-                
-                # Analog inputs
-                analog = controller.get("analog", {})
-                if analog:
-                    print("\n  ANALOG INPUTS:")
-                    for input_name, input_value in analog.items():
-                        if isinstance(input_value, dict):
-                            print(f"    {input_name.capitalize()}: X={input_value.get('x', 0):.2f}, Y={input_value.get('y', 0):.2f}")
-                        else:
-                            print(f"    {input_name.capitalize()}: {input_value:.2f}")
-            else:
-                print(f"\n{hand.upper()} CONTROLLER: Not tracked")
-
-def display_3d(data):
-    global mesh_sphere, vis
-
-    for hand in ["left", "right"]:
-        if hand in data:
+# Display names for raw button / analog names, filled on first sight
+_PRETTY = {}
+
+def pretty_name(name):
+    """Display name for a raw name, e.g. application_menu -> Application menu"""
+    pretty = _PRETTY.get(name)
+    if pretty is None:
+        pretty = _PRETTY[name] = name.replace('_', ' ').capitalize()
+    return pretty
+
+def button_status(bits, pressed_bit, touched_bit=None):
+    """PRESSED / TOUCHED / --- for a packed button"""
+    if bits >> pressed_bit & 1:
+        return "PRESSED"
+    if touched_bit is not None and bits >> touched_bit & 1:
+        return "TOUCHED"
+    return "---"
+
+def display_simple(out):
+    """Append simplified controller data to the out lines"""
+    for i, hand in enumerate(HANDS):
+        if _TRK[i]:
+            out.append(_HAND_FMT.format(hand.upper()))
+            
+            # Position
+            out.append(_POS_FMT.format(*_POS[i]))
+            
+            # Main buttons
+            bits = int(_BTN[i])
+            present = int(_BTN_PRESENT[i])
+            out.append("\n  MAIN BUTTONS:")
+            for _, pretty, bit in _MAIN_BTNS:
+                if present >> bit & 1:
+                    out.append(_BTN_FMT.format(pretty, button_status(bits, bit)))
+            
+            # Trackpad
+            if present >> BTN_TRACKPAD_PRESSED & 1:
+                out.append(_BTN_FMT.format("Trackpad", button_status(bits, BTN_TRACKPAD_PRESSED, BTN_TRACKPAD_TOUCHED)))
+            
+            # Analog inputs
+            trigger, pad_x, pad_y = _ANALOG[i]
+            out.append("\n  ANALOG INPUTS:")
+            out.append(_VALUE_FMT.format("Trigger", trigger))
+            out.append(_AXES_FMT.format("Trackpad", pad_x, pad_y))
+        else:
+            out.append(_UNTRACKED_FMT.format(hand.upper()))
+
+def display_full(data, out):
+    """Append detailed controller data to the out lines"""
+    for i, hand in enumerate(HANDS):
+        if _TRK[i]:
             controller = data[hand]
-            if controller.get("tracked", False):
-                pos = controller.get("position", {})
-                print(pos)
-                rot = controller.get("rotation", {})
-                if pos and rot:
-                    # Set position
-                    mesh_sphere.translate([pos.get('x', 0), pos.get('y', 0), pos.get('z', 0)], relative=False)
-                    
-                    # Set orientation
-                    R = o3d.geometry.get_rotation_matrix_from_xyz(
-                        [np.radians(rot.get('roll', 0)), np.radians(rot.get('pitch', 0)), np.radians(rot.get('yaw', 0))]
-                    )
-                    mesh_sphere.rotate(R, center=mesh_sphere.get_center())
-                    
-                    # Update camera to track the sphere
-                    ctr = vis.get_view_control()
-                    ctr.set_lookat([pos.get('x', 0), pos.get('y', 0), pos.get('z', 0)])
-                    
-                    vis.update_geometry(mesh_sphere)
-                    vis.poll_events()
-                    vis.update_renderer()
-                    # time.sleep(0.1)
+            out.append(_HAND_FMT.format(hand.upper()))
+            
+            # Position and rotation
+            out.append(_POS_FMT.format(*_POS[i]))
+            out.append(_ROT_FMT.format(*_RPY[i]))
+            
+            # All buttons (every button under buttons_all when the sender runs with --verbose)
+            buttons = controller.get("buttons_all") or controller.get("buttons", {})
+            if buttons:
+                out.append("\n  ALL BUTTONS:")
+                for btn_name, btn_state in buttons.items():
+                    # Checked per value: a restarted sender may switch a name between bool and dict
+                    if type(btn_state) is dict:
+                        status = "PRESSED" if btn_state.get("pressed", False) else ("TOUCHED" if btn_state.get("touched", False) else "---")
+                    else:
+                        status = "PRESSED" if btn_state else "---"
+                    out.append(_BTN_FMT.format(pretty_name(btn_name), status))
+            
+            # Analog inputs
+            analog = controller.get("analog", {})
+            if analog:
+                out.append("\n  ANALOG INPUTS:")
+                for input_name, input_value in analog.items():
+                    if isinstance(input_value, dict):
+                        out.append(_AXES_FMT.format(pretty_name(input_name), input_value.get('x', 0), input_value.get('y', 0)))
+                    else:
+                        out.append(_VALUE_FMT.format(pretty_name(input_name), input_value))
+        else:
+            out.append(_UNTRACKED_FMT.format(hand.upper()))
 
 
 if __name__ == "__main__":
@@ -206,6 +615,28 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=5555, help="UDP port to listen on (default: 5555)")
     parser.add_argument("--mode", choices=["simple", "full", "raw", "3d"], default="simple", 
                         help="Display mode: simple, full, raw JSON, or 3D visualization (default: simple)")
+    parser.add_argument("--rcvbuf", type=int, default=4 * 1024 * 1024,
+                        help="UDP receive buffer size in bytes (default: 4 MB, capped by net.core.rmem_max)")
+    parser.add_argument("--wire", choices=["json", "msgpack"], default="json",
+                        help="Packet format sent by main.py --wire (default: json)")
+    parser.add_argument("--recv-thread", action="store_true",
+                        help="Receive packets on a background thread, separate from drawing")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes binding the port with SO_REUSEPORT (simple and 3d modes only, default: 1)")
     args = parser.parse_args()
     
-    receive_controller_data(args.port, args.mode)
+    if args.wire == "msgpack" and msgpack is None:
+        print("msgpack is not installed. Please install it with:")
+        print("pip install msgpack")
+        sys.exit(1)
+    
+    if args.workers > 1:
+        if not hasattr(socket, "SO_REUSEPORT"):
+            print("--workers needs SO_REUSEPORT, which this platform does not support")
+            sys.exit(1)
+        if args.mode not in ("simple", "3d"):
+            # Workers share only the projected pose/button state, not the whole packet
+            print("--workers only works with --mode simple or 3d")
+            sys.exit(1)
+    
+    receive_controller_data(args.port, args.mode, args.rcvbuf, args.wire, args.recv_thread, args.workers)